@@ -1,13 +1,26 @@
 import json
 import boto3
+import functools
 import os
 import decimal
-from datetime import datetime, timezone, timedelta, date
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone, date
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeSerializer
 from pydantic import ValidationError
 import logging
 import sys
+import time
+
+try:
+    # Optional: speeds up request parsing and create_response, stdlib json
+    # is the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
 sys.path.append("/opt/python")
 from models import (
@@ -20,14 +33,72 @@ from models import (
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# DynamoDB accepts at most 25 put requests per BatchWriteItem call
+BATCH_WRITE_LIMIT = 25
+BATCH_WRITE_MAX_ATTEMPTS = 5
+BATCH_WRITE_BACKOFF_SECONDS = 0.05
+# Batches in flight at once; kept small so a long range doesn't trip throttling.
+# Clamped to 1 so a bad setting can't make ThreadPoolExecutor reject it
+SLOT_BATCH_CONCURRENCY = max(1, int(os.environ.get("SLOT_BATCH_CONCURRENCY", "4")))
+
+# Larger pool for the concurrent slot batch writes; adaptive retries back
+# off client-side when DynamoDB throttles
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+)
+
+# Generated slots expire this long after their date
+SLOT_TTL_DAYS = 90
+# Day ordinals start at 0001-01-01 (a Monday), so (ordinal - 1) % 7 is the
+# weekday and TTLs can be computed without building datetimes
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_SECONDS_PER_DAY = 86400
+
+# Only the slot attributes each read endpoint returns. The venue range returns
+# every field VenueSlotsResponse documents (all but ttl); "date" is a reserved
+# word, so it goes through an expression attribute name
+AVAILABILITY_PROJECTION = "venue_id, slot_time, available_capacity, total_capacity"
+VENUE_SLOTS_PROJECTION = (
+    "venue_date, slot_time, venue_id, #date, available_capacity, "
+    "total_capacity, booked_count, created_at"
+)
+VENUE_SLOTS_PROJECTION_NAMES = {"#date": "date"}
+
+# Marshals the generated slots to wire format for the low-level client
+_SERIALIZER = TypeSerializer()
+
+
+@functools.lru_cache(maxsize=None)
+def get_dynamodb():
+    """Container-wide DynamoDB resource, created on the first invocation"""
+    return boto3.resource("dynamodb", **_dynamodb_kwargs())
+
+
+@functools.lru_cache(maxsize=None)
+def get_dynamodb_client():
+    """
+    Container-wide low-level client for the bulk slot writes. Unlike the
+    resource's client it takes items already in wire format, so each batch
+    skips boto3's per-attribute marshalling.
+    """
+    return boto3.client("dynamodb", **_dynamodb_kwargs())
+
+
+def _dynamodb_kwargs():
+    dynamodb_kwargs = {
+        "region_name": os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
+        "config": DYNAMODB_CONFIG,
+    }
+    if os.environ.get("AWS_SAM_LOCAL"):
+        dynamodb_kwargs["endpoint_url"] = "http://dynamodb-local:8000"
+    return dynamodb_kwargs
+
+
 def lambda_handler(event, context):
     """Lambda handler for slot management operations"""
     try:
-        # Initialize DynamoDB
-        dynamodb_kwargs = {"region_name": os.environ.get("AWS_DEFAULT_REGION", "us-east-1")}
-        if os.environ.get("AWS_SAM_LOCAL"):
-            dynamodb_kwargs["endpoint_url"] = "http://dynamodb-local:8000"
-        dynamodb = boto3.resource("dynamodb", **dynamodb_kwargs)
+        dynamodb = get_dynamodb()
 
         slots_table = dynamodb.Table(os.environ.get("SLOTS_TABLE"))
         venues_table = dynamodb.Table(os.environ.get("VENUES_TABLE"))
@@ -58,7 +129,7 @@ def batch_generate_slots(slots_table, venues_table, event):
     Body: {venue_id, start_date, end_date}
     """
     try:
-        body = json.loads(event.get("body", "{}"))
+        body = decode_json(event.get("body", "{}"))
 
         # Validate with Pydantic model
         try:
@@ -88,31 +159,62 @@ def batch_generate_slots(slots_table, venues_table, event):
         if start_date > end_date:
             return create_response(400, {"error": "start_date must be before or equal to end_date"})
 
-        # Generate slots for date range
-        slots_created = 0
-        current_date = start_date
-
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            day_slots = generate_slots_for_date(venue, date_str)
-
-            # Batch write slots (DynamoDB batch limit is 25)
-            with slots_table.batch_writer() as batch:
-                for slot in day_slots:
-                    batch.put_item(Item={
-                        "venue_date": f"{venue_id}#{date_str}",
-                        "slot_time": slot["time"],
-                        "venue_id": venue_id,
-                        "date": date_str,
-                        "available_capacity": slot["available_capacity"],
-                        "total_capacity": slot["total_capacity"],
-                        "booked_count": 0,
-                        "created_at": datetime.now(timezone.utc).isoformat(),
-                        "ttl": int(datetime.combine(current_date + timedelta(days=90), datetime.min.time()).replace(tzinfo=timezone.utc).timestamp())
-                    })
-                    slots_created += 1
-
-            current_date += timedelta(days=1)
+        # Generate slots for date range. Operating hours are parsed once
+        # into per-weekday slot times, then reused for every date. The
+        # marshalled {"S": time} values are built once per weekday too and
+        # shared by every item with that time; botocore only reads them.
+        weekday_slots = [
+            [{"S": slot_time} for slot_time in slot_times]
+            for slot_times in _build_weekday_slot_template(venue)
+        ]
+        created_at = datetime.now(timezone.utc).isoformat()
+        slot_items = []
+        # One item per slot, not one per day: bookings reserve capacity with a
+        # conditional update_item on each slot item, and the date-venue-index
+        # query filters on available_capacity, neither of which works against
+        # a packed list attribute.
+        # Every item shares these fields, marshalled once; each date and slot
+        # copies the prototype and fills in the rest in wire format
+        slot_prototype = {
+            key: _SERIALIZER.serialize(value)
+            for key, value in (
+                ("venue_date", None),
+                ("slot_time", None),
+                ("venue_id", venue_id),
+                ("date", None),
+                # A venue without capacity has no slot times, so this
+                # prototype is never copied
+                ("available_capacity", venue.get("capacity")),
+                ("total_capacity", venue.get("capacity")),
+                ("booked_count", 0),
+                ("created_at", created_at),
+                ("ttl", None),
+            )
+        }
+
+        for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+            slot_times = weekday_slots[(ordinal - 1) % 7]
+            if not slot_times:
+                continue
+
+            date_str = date.fromordinal(ordinal).isoformat()
+            day_prototype = slot_prototype.copy()
+            day_prototype["venue_date"] = {"S": f"{venue_id}#{date_str}"}
+            day_prototype["date"] = {"S": date_str}
+            # Midnight UTC, SLOT_TTL_DAYS after the slot's date
+            ttl = (ordinal + SLOT_TTL_DAYS - _EPOCH_ORDINAL) * _SECONDS_PER_DAY
+            day_prototype["ttl"] = {"N": str(ttl)}
+
+            for wire_slot_time in slot_times:
+                item = day_prototype.copy()
+                item["slot_time"] = wire_slot_time
+                slot_items.append(item)
+
+        unprocessed = batch_put_items(slots_table, slot_items)
+        if unprocessed:
+            logger.error(f"{len(unprocessed)} slots for venue {venue_id} were not written after retries")
+            return create_response(500, {"error": "Failed to generate slots"})
+        slots_created = len(slot_items)
 
         logger.info(f"Generated {slots_created} slots for venue {venue_id}")
         return create_response(201, {
@@ -129,6 +231,46 @@ def batch_generate_slots(slots_table, venues_table, event):
         return create_response(500, {"error": "Failed to generate slots"})
 
 
+def batch_put_items(table, items):
+    """
+    Write wire-format items in BatchWriteItem calls of up to BATCH_WRITE_LIMIT,
+    with up to SLOT_BATCH_CONCURRENCY batches in flight at once.
+    Returns the put requests still unprocessed after BATCH_WRITE_MAX_ATTEMPTS.
+    """
+    client = get_dynamodb_client()
+    requests = [{"PutRequest": {"Item": item}} for item in items]
+    batches = [
+        requests[i:i + BATCH_WRITE_LIMIT]
+        for i in range(0, len(requests), BATCH_WRITE_LIMIT)
+    ]
+    if len(batches) <= 1:
+        return [r for batch in batches for r in _write_batch(client, table.name, batch)]
+
+    unprocessed = []
+    with ThreadPoolExecutor(max_workers=SLOT_BATCH_CONCURRENCY) as executor:
+        futures = [
+            executor.submit(_write_batch, client, table.name, batch)
+            for batch in batches
+        ]
+        # A ClientError from any batch is re-raised here for the caller
+        for future in as_completed(futures):
+            unprocessed.extend(future.result())
+
+    return unprocessed
+
+
+def _write_batch(client, table_name, pending):
+    """Send one batch, re-sending its UnprocessedItems with exponential backoff"""
+    for attempt in range(BATCH_WRITE_MAX_ATTEMPTS):
+        if attempt:
+            time.sleep(BATCH_WRITE_BACKOFF_SECONDS * 2 ** attempt)
+        response = client.batch_write_item(RequestItems={table_name: pending})
+        pending = response.get("UnprocessedItems", {}).get(table_name, [])
+        if not pending:
+            break
+    return pending
+
+
 def query_availability(slots_table, event):
     """
     Query slots across multiple venues by date
@@ -143,27 +285,24 @@ def query_availability(slots_table, event):
 
         # Validate date format
         try:
-            datetime.strptime(date_str, "%Y-%m-%d")
+            _parse_date(date_str)
         except ValueError:
             return create_response(400, {"error": "Invalid date format. Use YYYY-MM-DD"})
 
-        # Query GSI: date-venue-index
-        response = slots_table.query(
+        # Query GSI: date-venue-index, one partition per date
+        slots = query_all_pages(
+            slots_table,
             IndexName="date-venue-index",
             KeyConditionExpression=Key("date").eq(date_str),
             FilterExpression="available_capacity > :zero",
-            ExpressionAttributeValues={":zero": 0}
+            ExpressionAttributeValues={":zero": 0},
+            ProjectionExpression=AVAILABILITY_PROJECTION
         )
 
-        slots = response.get("Items", [])
-
         # Group by venue
-        venues_availability = {}
+        venues_availability = defaultdict(list)
         for slot in slots:
-            venue_id = slot["venue_id"]
-            if venue_id not in venues_availability:
-                venues_availability[venue_id] = []
-            venues_availability[venue_id].append({
+            venues_availability[slot["venue_id"]].append({
                 "time": slot["slot_time"],
                 "available": slot["available_capacity"],
                 "total": slot["total_capacity"]
@@ -171,7 +310,7 @@ def query_availability(slots_table, event):
 
         return create_response(200, {
             "date": date_str,
-            "venues_with_availability": venues_availability,
+            "venues_with_availability": dict(venues_availability),
             "total_venues": len(venues_availability)
         })
 
@@ -180,6 +319,17 @@ def query_availability(slots_table, event):
         return create_response(500, {"error": "Failed to query availability"})
 
 
+def query_all_pages(table, **query_kwargs):
+    """Run a Query, following LastEvaluatedKey past the 1 MB page limit"""
+    items = []
+    while True:
+        response = table.query(**query_kwargs)
+        items.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return items
+        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
 def get_venue_slots_range(slots_table, venue_id, event):
     """
     Get all slots for a venue in a date range
@@ -198,16 +348,17 @@ def get_venue_slots_range(slots_table, venue_id, event):
 
         # Query by venue_date composite key
         slots_by_date = {}
-        current = datetime.strptime(start_date, "%Y-%m-%d").date()
-        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        start_ordinal = _parse_date(start_date).toordinal()
+        end_ordinal = _parse_date(end_date).toordinal()
 
-        while current <= end:
-            date_str = current.strftime("%Y-%m-%d")
+        for ordinal in range(start_ordinal, end_ordinal + 1):
+            date_str = date.fromordinal(ordinal).isoformat()
             response = slots_table.query(
-                KeyConditionExpression=Key("venue_date").eq(f"{venue_id}#{date_str}")
+                KeyConditionExpression=Key("venue_date").eq(f"{venue_id}#{date_str}"),
+                ProjectionExpression=VENUE_SLOTS_PROJECTION,
+                ExpressionAttributeNames=VENUE_SLOTS_PROJECTION_NAMES
             )
             slots_by_date[date_str] = response.get("Items", [])
-            current += timedelta(days=1)
 
         return create_response(200, {
             "venue_id": venue_id,
@@ -225,58 +376,133 @@ def get_venue_slots_range(slots_table, venue_id, event):
 def generate_slots_for_date(venue, date_str):
     """Generate slot data for a specific date based on venue operating hours"""
     try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-        day_of_week = date_obj.strftime("%A").lower()
-
-        operating_hours = venue.get("operating_hours", {})
-        if day_of_week not in operating_hours:
-            return []
-
-        day_hours = operating_hours[day_of_week]
-        if not day_hours.get("open", True):
-            return []
-
-        # Parse times
-        start_time = datetime.strptime(day_hours["start"], "%H:%M").time()
-        end_time = datetime.strptime(day_hours["end"], "%H:%M").time()
-        slot_duration = timedelta(minutes=int(venue.get("slot_duration", 60)))
-
-        # Generate slots
-        slots = []
-        current_time = datetime.combine(date_obj, start_time)
-        end_datetime = datetime.combine(date_obj, end_time)
-
-        while current_time < end_datetime:
-            slots.append({
-                "time": current_time.strftime("%H:%M"),
-                "available_capacity": venue["capacity"],
-                "total_capacity": venue["capacity"]
-            })
-            current_time += slot_duration
-
-        return slots
-
-    except (ValueError, KeyError) as e:
+        date_obj = _parse_date(date_str)
+    except ValueError as e:
         logger.error(f"Error generating slots for {date_str}: {str(e)}")
         return []
 
+    slot_times = _build_weekday_slot_template(venue)[date_obj.weekday()]
+    return [
+        {
+            "time": slot_time,
+            "available_capacity": venue["capacity"],
+            "total_capacity": venue["capacity"],
+        }
+        for slot_time in slot_times
+    ]
+
+
+def _parse_date(date_str):
+    """
+    Parse a "YYYY-MM-DD" date. date.fromisoformat alone would also accept
+    the basic ("20240101") and week ("2024-W01-1") ISO forms.
+    """
+    if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+        raise ValueError(f"expected YYYY-MM-DD, got {date_str!r}")
+    return date.fromisoformat(date_str)
+
+
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+def _build_weekday_slot_template(venue):
+    """
+    Slot start times ("HH:MM") for each weekday, indexed by date.weekday()
+    (Monday is 0). Closed or malformed days get no times.
+    """
+    if "capacity" not in venue:
+        logger.error(f"Venue {venue.get('id')} has no capacity")
+        return [() for _ in _WEEKDAYS]
+
+    try:
+        slot_duration = int(venue.get("slot_duration", 60))
+        if slot_duration <= 0:
+            raise ValueError("slot_duration must be positive")
+    except (TypeError, ValueError) as e:
+        logger.error(f"Invalid slot_duration for venue {venue.get('id')}: {str(e)}")
+        return [() for _ in _WEEKDAYS]
+
+    operating_hours = venue.get("operating_hours", {})
+    template = []
+
+    for day_of_week in _WEEKDAYS:
+        slot_times = ()
+        day_hours = operating_hours.get(day_of_week)
+
+        if day_hours is not None and day_hours.get("open", True):
+            try:
+                slot_times = _day_slot_times(day_hours["start"], day_hours["end"], slot_duration)
+            except (ValueError, KeyError) as e:
+                logger.error(f"Invalid operating hours for {day_of_week}: {str(e)}")
+
+        template.append(slot_times)
+
+    return template
+
+
+@functools.lru_cache(maxsize=256)
+def _day_slot_times(start, end, slot_duration):
+    """
+    Slot start times for one day's hours, memoized for the container's
+    lifetime: most venues share a handful of (start, end, duration) shapes,
+    so warm invocations skip the parsing and formatting entirely.
+    Returns a tuple so the cached value can't be mutated by a caller.
+    """
+    start_minute = _minutes_since_midnight(start)
+    end_minute = _minutes_since_midnight(end)
+    return tuple(
+        f"{minute // 60:02d}:{minute % 60:02d}"
+        for minute in range(start_minute, end_minute, slot_duration)
+    )
+
+
+def _minutes_since_midnight(time_str):
+    """Parse an "HH:MM" time into minutes past midnight"""
+    hours, minutes = map(int, time_str.split(":"))
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f"time out of range: {time_str!r}")
+    return hours * 60 + minutes
+
+
+# Shared by every response rather than rebuilt per call; nothing mutates a
+# response's headers after create_response returns it
+RESPONSE_HEADERS = {
+    "Content-Type": "application/json",
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type,Authorization"
+}
+
 
 def create_response(status_code, body):
     """Create standardized API response"""
-    def serializer(o):
-        if isinstance(o, decimal.Decimal):
-            return float(o)
-        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
-
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type,Authorization"
-        },
-        "body": json.dumps(body, default=serializer)
+        "headers": RESPONSE_HEADERS,
+        "body": encode_json(body, _json_default)
     }
+
+
+def _json_default(o):
+    if isinstance(o, decimal.Decimal):
+        return float(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def encode_json(body, default):
+    """Serialize a response body with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(body, default=default).decode()
+    return json.dumps(body, default=default)
+
+
+def decode_json(body):
+    """
+    Parse a request body with orjson when it is installed. Its decode error
+    subclasses json.JSONDecodeError, so callers handle both the same way.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
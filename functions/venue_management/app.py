@@ -1,13 +1,24 @@
 import json
 import boto3
+import functools
 import uuid
 import os
 import decimal
-from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta, date
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from pydantic import ValidationError
 import logging
+import re
 import sys
+import threading
+
+try:
+    # Faster C encoder; the handlers fall back to stdlib json without it
+    import orjson
+except ImportError:
+    orjson = None
 
 sys.path.append("/opt/python")
 from models import (
@@ -21,8 +32,37 @@ from models import (
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# DynamoDB resource will be initialized in lambda_handler
-dynamodb = None
+# Larger pool for the concurrent list_venues scans; adaptive retries back
+# off client-side when DynamoDB throttles
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+)
+
+# Parallel Scan segments read concurrently by list_venues
+LIST_VENUES_SEGMENTS = 4
+
+# Indexed by date.weekday() (Monday is 0)
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_VALID_DAYS = frozenset(_WEEKDAYS)
+# 24-hour "HH:MM", the same pattern the OpenAPI schema declares
+_TIME_RE = re.compile(r"([01]\d|2[0-3]):[0-5]\d")
+
+
+@functools.lru_cache(maxsize=None)
+def get_dynamodb():
+    """
+    DynamoDB resource shared by every invocation in this container, so warm
+    requests reuse its HTTPS connection pool. Built on first use rather than
+    at import so tests can patch boto3 (and cache_clear() between them).
+    """
+    dynamodb_kwargs = {
+        "region_name": os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
+        "config": DYNAMODB_CONFIG,
+    }
+    if os.environ.get("AWS_SAM_LOCAL"):
+        dynamodb_kwargs["endpoint_url"] = "http://dynamodb-local:8000"
+    return boto3.resource("dynamodb", **dynamodb_kwargs)
 
 
 def lambda_handler(event, context):
@@ -30,13 +70,7 @@ def lambda_handler(event, context):
     Main Lambda handler for venue management operations
     """
     try:
-        # Initialize DynamoDB resource - use local endpoint if available
-        dynamodb_kwargs = {
-            "region_name": os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
-        }
-        if os.environ.get("AWS_SAM_LOCAL"):
-            dynamodb_kwargs["endpoint_url"] = "http://dynamodb-local:8000"
-        dynamodb = boto3.resource("dynamodb", **dynamodb_kwargs)
+        dynamodb = get_dynamodb()
 
         # Get environment variables
         venues_table_name = os.environ.get("VENUES_TABLE")
@@ -78,7 +112,7 @@ def create_venue(table, dynamodb, event):
     """Create a new venue"""
     try:
         # Parse request body
-        body = json.loads(event.get("body", "{}"))
+        body = decode_json(event.get("body", "{}"))
 
         # Validate with Pydantic model - replaces all manual validation!
         try:
@@ -153,10 +187,32 @@ def list_venues(table, event):
         query_params = event.get("queryStringParameters") or {}
         limit = int(query_params.get("limit", 50))
 
-        # Scan table for venues
-        response = table.scan(Limit=limit)
-
-        venues = response.get("Items", [])
+        # Scan the table's segments in parallel through the table's client:
+        # boto3 clients are thread-safe, resources (and their Tables) are not.
+        # Each page asks for an even share of the limit and every segment
+        # stops once the combined total reaches it, so a request reads about
+        # limit items rather than limit per segment
+        client = table.meta.client
+        page_size = -(-limit // LIST_VENUES_SEGMENTS)
+        venues = []
+        lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=LIST_VENUES_SEGMENTS) as executor:
+            futures = [
+                executor.submit(
+                    scan_segment,
+                    client,
+                    table.name,
+                    segment,
+                    page_size,
+                    limit,
+                    venues,
+                    lock,
+                )
+                for segment in range(LIST_VENUES_SEGMENTS)
+            ]
+            for future in futures:
+                future.result()
+        venues = venues[:limit]
 
         return create_response(200, {"venues": venues, "count": len(venues)})
 
@@ -165,11 +221,34 @@ def list_venues(table, event):
         return create_response(500, {"error": "Failed to list venues"})
 
 
+def scan_segment(client, table_name, segment, page_size, limit, venues, lock):
+    """
+    Append one parallel Scan segment's items to venues, page_size items per
+    page, until the segment is exhausted or venues holds limit items
+    """
+    scan_kwargs = {
+        "TableName": table_name,
+        "Segment": segment,
+        "TotalSegments": LIST_VENUES_SEGMENTS,
+        "Limit": page_size,
+    }
+    while True:
+        with lock:
+            if len(venues) >= limit:
+                return
+        response = client.scan(**scan_kwargs)
+        with lock:
+            venues.extend(response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
 def update_venue(table, venue_id, event):
     """Update venue"""
     try:
         # Parse request body
-        body = json.loads(event.get("body", "{}"))
+        body = decode_json(event.get("body", "{}"))
 
         # Check if venue exists
         existing_venue = table.get_item(Key={"id": venue_id})
@@ -275,8 +354,6 @@ def delete_venue(table, venue_id):
 
 def auto_generate_initial_slots(venue_id, venue_data, slots_table):
     """Automatically generate slots for new venues (next 30 days)"""
-    from datetime import date
-
     start_date = date.today()
     end_date = start_date + timedelta(days=30)
 
@@ -311,8 +388,7 @@ def auto_generate_initial_slots(venue_id, venue_data, slots_table):
 def generate_slots_for_date_helper(venue, date_str):
     """Helper to generate slot data for a specific date"""
     try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-        day_of_week = date_obj.strftime("%A").lower()
+        day_of_week = _WEEKDAYS[date.fromisoformat(date_str).weekday()]
 
         operating_hours = venue.get("operating_hours", {})
         if day_of_week not in operating_hours:
@@ -322,44 +398,42 @@ def generate_slots_for_date_helper(venue, date_str):
         if not day_hours.get("open", True):
             return []
 
-        start_time = datetime.strptime(day_hours["start"], "%H:%M").time()
-        end_time = datetime.strptime(day_hours["end"], "%H:%M").time()
-        slot_duration = timedelta(minutes=int(venue.get("slot_duration", 60)))
+        start_minute = _minutes_since_midnight(day_hours["start"])
+        end_minute = _minutes_since_midnight(day_hours["end"])
+        slot_duration = int(venue.get("slot_duration", 60))
 
+        prototype = {
+            "time": None,
+            "available_capacity": venue["capacity"],
+            "total_capacity": venue["capacity"]
+        }
         slots = []
-        current_time = datetime.combine(date_obj, start_time)
-        end_datetime = datetime.combine(date_obj, end_time)
-
-        while current_time < end_datetime:
-            slots.append({
-                "time": current_time.strftime("%H:%M"),
-                "available_capacity": venue["capacity"],
-                "total_capacity": venue["capacity"]
-            })
-            current_time += slot_duration
-
+        # range() rejects a zero step with ValueError, so a bad duration
+        # yields no slots instead of looping forever
+        for minute in range(start_minute, end_minute, slot_duration):
+            slot = prototype.copy()
+            slot["time"] = f"{minute // 60:02d}:{minute % 60:02d}"
+            slots.append(slot)
         return slots
     except (ValueError, KeyError):
         return []
 
 
+def _minutes_since_midnight(time_str):
+    """Parse an "HH:MM" time into minutes past midnight"""
+    hours, minutes = map(int, time_str.split(":"))
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f"time out of range: {time_str!r}")
+    return hours * 60 + minutes
+
+
 def validate_operating_hours(operating_hours):
     """Validate operating hours format"""
     if not isinstance(operating_hours, dict):
         return False
 
-    valid_days = [
-        "monday",
-        "tuesday",
-        "wednesday",
-        "thursday",
-        "friday",
-        "saturday",
-        "sunday",
-    ]
-
     for day, hours in operating_hours.items():
-        if day not in valid_days:
+        if day not in _VALID_DAYS:
             return False
 
         if not isinstance(hours, dict):
@@ -373,32 +447,54 @@ def validate_operating_hours(operating_hours):
         if "start" not in hours or "end" not in hours:
             return False
 
-        try:
-            datetime.strptime(hours["start"], "%H:%M")
-            datetime.strptime(hours["end"], "%H:%M")
-        except ValueError:
+        start, end = hours["start"], hours["end"]
+        if not (isinstance(start, str) and _TIME_RE.fullmatch(start)):
+            return False
+        if not (isinstance(end, str) and _TIME_RE.fullmatch(end)):
             return False
 
     return True
 
 
-def create_response(status_code, body):
-    """Create a standardized API response"""
+# Shared by every response rather than rebuilt per call; nothing mutates a
+# response's headers after create_response returns it
+RESPONSE_HEADERS = {
+    "Content-Type": "application/json",
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
+}
 
-    def default_serializer(o):
-        if isinstance(o, decimal.Decimal):
-            return float(o)
-        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
 
+def create_response(status_code, body):
+    """Create a standardized API response"""
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
-        },
-        "body": json.dumps(body, default=default_serializer) if body else "",
+        "headers": RESPONSE_HEADERS,
+        "body": encode_json(body, _json_default) if body else "",
     }
+
+
+def _json_default(o):
+    if isinstance(o, decimal.Decimal):
+        return float(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def encode_json(body, default):
+    """Serialize a response body with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(body, default=default).decode()
+    return json.dumps(body, default=default)
+
+
+def decode_json(body):
+    """
+    Parse a request body with orjson when it is installed. Its decode error
+    subclasses json.JSONDecodeError, so callers handle both the same way.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
@@ -70,17 +70,23 @@ def mock_is_user_verified(event):
     return claims.get("email_verified", True)
 
 
+_mock_auth_module = None
+
+
 def setup_auth_mocks():
-    """Set up all auth mocks before importing app modules"""
-    # Create the mock auth module
-    mock_auth_module = MagicMock()
-    mock_auth_module.require_auth = mock_require_auth
-    mock_auth_module.optional_auth = mock_optional_auth
-    mock_auth_module.get_user_id_from_event = mock_get_user_id_from_event
-    mock_auth_module.is_user_verified = mock_is_user_verified
+    """Set up all auth mocks before importing app modules (built once per process)"""
+    global _mock_auth_module
+
+    if _mock_auth_module is None:
+        # Create the mock auth module
+        _mock_auth_module = MagicMock()
+        _mock_auth_module.require_auth = mock_require_auth
+        _mock_auth_module.optional_auth = mock_optional_auth
+        _mock_auth_module.get_user_id_from_event = mock_get_user_id_from_event
+        _mock_auth_module.is_user_verified = mock_is_user_verified
 
     # Mock the auth module at the top level
-    sys.modules["auth"] = mock_auth_module
-    sys.modules["auth.app"] = mock_auth_module
+    sys.modules["auth"] = _mock_auth_module
+    sys.modules["auth.app"] = _mock_auth_module
 
-    return mock_auth_module
+    return _mock_auth_module
@@ -1,8 +1,5 @@
-import pytest
 import os
 import sys
-import boto3
-from moto import mock_aws
 
 # Add functions/shared to Python path so models can be imported
 # This simulates the Lambda Layer path (/opt/python)
@@ -10,120 +7,17 @@ shared_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'function
 if shared_path not in sys.path:
     sys.path.insert(0, shared_path)
 
+# Add functions/ so handlers import under stable package names
+# (e.g. dog_management.app) instead of colliding on the bare name "app"
+functions_path = os.path.dirname(shared_path)
+if functions_path not in sys.path:
+    sys.path.insert(0, functions_path)
 
-@pytest.fixture
-def mock_env():
-    """Mock environment variables for testing"""
-    env_vars = {
-        "DOGS_TABLE": "dogs-test",
-        "OWNERS_TABLE": "owners-test",
-        "BOOKINGS_TABLE": "bookings-test",
-        "VENUES_TABLE": "venues-test",
-        "ENVIRONMENT": "test",
-        "AWS_ACCESS_KEY_ID": "testing",
-        "AWS_SECRET_ACCESS_KEY": "testing",
-        "AWS_SECURITY_TOKEN": "testing",
-        "AWS_SESSION_TOKEN": "testing",
-        "AWS_DEFAULT_REGION": "us-east-1",
-    }
 
-    for key, value in env_vars.items():
-        os.environ[key] = value
-
-    yield env_vars
-
-    # Cleanup
-    for key in env_vars.keys():
-        if key in os.environ:
-            del os.environ[key]
-
-
-@pytest.fixture
-def aws_credentials():
-    """Mock AWS credentials for testing"""
-    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
-    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
-    os.environ["AWS_SECURITY_TOKEN"] = "testing"
-    os.environ["AWS_SESSION_TOKEN"] = "testing"
-    os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
-
-
-@pytest.fixture
-def dynamodb_setup(aws_credentials):
-    """Set up mock DynamoDB for testing"""
-    with mock_aws():
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-        # Create test tables
-        tables = {
-            "dogs-test": {
-                "KeySchema": [{"AttributeName": "id", "KeyType": "HASH"}],
-                "AttributeDefinitions": [
-                    {"AttributeName": "id", "AttributeType": "S"},
-                    {"AttributeName": "owner_id", "AttributeType": "S"},
-                ],
-                "GlobalSecondaryIndexes": [
-                    {
-                        "IndexName": "owner-index",
-                        "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                        "Projection": {"ProjectionType": "ALL"},
-                    }
-                ],
-            },
-            "owners-test": {
-                "KeySchema": [{"AttributeName": "id", "KeyType": "HASH"}],
-                "AttributeDefinitions": [
-                    {"AttributeName": "id", "AttributeType": "S"},
-                    {"AttributeName": "email", "AttributeType": "S"},
-                ],
-                "GlobalSecondaryIndexes": [
-                    {
-                        "IndexName": "email-index",
-                        "KeySchema": [{"AttributeName": "email", "KeyType": "HASH"}],
-                        "Projection": {"ProjectionType": "ALL"},
-                    }
-                ],
-            },
-            "bookings-test": {
-                "KeySchema": [{"AttributeName": "id", "KeyType": "HASH"}],
-                "AttributeDefinitions": [
-                    {"AttributeName": "id", "AttributeType": "S"},
-                    {"AttributeName": "owner_id", "AttributeType": "S"},
-                    {"AttributeName": "start_time", "AttributeType": "S"},
-                ],
-                "GlobalSecondaryIndexes": [
-                    {
-                        "IndexName": "owner-time-index",
-                        "KeySchema": [
-                            {"AttributeName": "owner_id", "KeyType": "HASH"},
-                            {"AttributeName": "start_time", "KeyType": "RANGE"},
-                        ],
-                        "Projection": {"ProjectionType": "ALL"},
-                    }
-                ],
-            },
-            "venues-test": {
-                "KeySchema": [{"AttributeName": "id", "KeyType": "HASH"}],
-                "AttributeDefinitions": [
-                    {"AttributeName": "id", "AttributeType": "S"},
-                ],
-            },
-        }
-
-        for table_name, table_config in tables.items():
-            create_table_kwargs = {
-                "TableName": table_name,
-                "KeySchema": table_config["KeySchema"],
-                "AttributeDefinitions": table_config["AttributeDefinitions"],
-                "BillingMode": "PAY_PER_REQUEST",
-            }
-
-            # Only add GlobalSecondaryIndexes if they exist
-            if table_config.get("GlobalSecondaryIndexes"):
-                create_table_kwargs["GlobalSecondaryIndexes"] = table_config[
-                    "GlobalSecondaryIndexes"
-                ]
-
-            dynamodb.create_table(**create_table_kwargs)
-
-        yield dynamodb
+def pytest_addoption(parser):
+    parser.addoption(
+        "--use-moto",
+        action="store_true",
+        default=False,
+        help="Run unit tests against moto instead of the in-process DynamoDB fake",
+    )
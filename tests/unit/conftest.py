@@ -0,0 +1,356 @@
+import json
+import pytest
+import boto3
+from dataclasses import dataclass
+from decimal import Decimal
+from types import SimpleNamespace
+from moto import mock_aws
+from moto.core import DEFAULT_ACCOUNT_ID
+from moto.dynamodb.models import dynamodb_backends
+
+from fake_dynamodb import FakeDynamoDB, to_wire
+
+# Install the auth mock before pytest imports any handler module, so the
+# handlers' "from auth import ..." resolves to it; runs once per session
+from auth_mock import setup_auth_mocks
+
+setup_auth_mocks()
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """Key schema for a mocked DynamoDB table (all key attributes are strings)"""
+
+    name: str
+    hash_key: str
+    range_key: str = None
+    # (index_name, hash_key, range_key or None)
+    indexes: tuple = ()
+
+    def as_kwargs(self):
+        key_attrs = [a for a in (self.hash_key, self.range_key) if a]
+        for _, index_hash, index_range in self.indexes:
+            key_attrs += [a for a in (index_hash, index_range) if a]
+
+        key_schema = [{"AttributeName": self.hash_key, "KeyType": "HASH"}]
+        if self.range_key:
+            key_schema.append({"AttributeName": self.range_key, "KeyType": "RANGE"})
+
+        kwargs = {
+            "TableName": self.name,
+            "KeySchema": key_schema,
+            "AttributeDefinitions": [
+                {"AttributeName": a, "AttributeType": "S"}
+                for a in dict.fromkeys(key_attrs)
+            ],
+            "BillingMode": "PAY_PER_REQUEST",
+        }
+        if self.indexes:
+            kwargs["GlobalSecondaryIndexes"] = [
+                {
+                    "IndexName": index_name,
+                    "KeySchema": [{"AttributeName": index_hash, "KeyType": "HASH"}]
+                    + (
+                        [{"AttributeName": index_range, "KeyType": "RANGE"}]
+                        if index_range
+                        else []
+                    ),
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+                for index_name, index_hash, index_range in self.indexes
+            ]
+        return kwargs
+
+
+# Table names the handlers read from their environment
+TABLE_ENV = {
+    "DOGS_TABLE": "dogs-test",
+    "OWNERS_TABLE": "owners-test",
+    "BOOKINGS_TABLE": "bookings-test",
+    "VENUES_TABLE": "venues-test",
+    "SLOTS_TABLE": "slots-test",
+}
+
+# Mirrors the table definitions in template.yaml
+TABLES_SPEC = (
+    TableSpec("dogs-test", "id", indexes=(("owner-index", "owner_id", None),)),
+    TableSpec("owners-test", "user_id"),
+    TableSpec(
+        "bookings-test",
+        "id",
+        indexes=(("owner-time-index", "owner_id", "start_time"),),
+    ),
+    TableSpec("venues-test", "id"),
+    TableSpec(
+        "slots-test",
+        "venue_date",
+        "slot_time",
+        indexes=(("date-venue-index", "date", "venue_id"),),
+    ),
+)
+
+# Rows owned by someone other than the mocked auth user (test-user-123), so
+# they never appear in that user's listings. Only the access-denied tests
+# read them and no handler call may change them, so they are seeded once
+# per session instead of per test.
+READONLY_ROWS = {
+    "dogs-test": (
+        {
+            "id": "dog-other-owner",
+            "name": "Buddy",
+            "owner_id": "different-user",
+            "breed": "Labrador",
+        },
+    ),
+    "bookings-test": (
+        {
+            "id": "booking-other-owner",
+            "dog_id": "dog-123",
+            "owner_id": "different-user",
+            "venue_id": "venue-123",
+            "service_type": "daycare",
+            "status": "pending",
+            "price": Decimal("120.0"),
+            "start_time": "2024-01-01T09:00:00+00:00",
+            "end_time": "2024-01-01T17:00:00+00:00",
+        },
+    ),
+}
+# Both tables are keyed on "id"
+_READONLY_KEYS = {
+    name: {row["id"] for row in rows} for name, rows in READONLY_ROWS.items()
+}
+
+
+def create_all(dynamodb, client):
+    """Create every table in TABLES_SPEC and return them keyed by name
+
+    Tables are created through the low-level client, which skips building
+    a resource Table per call; the handles returned are plain resource
+    Tables for the tests' high-level put_item/get_item calls.
+    """
+    for spec in TABLES_SPEC:
+        client.create_table(**spec.as_kwargs())
+    return {spec.name: dynamodb.Table(spec.name) for spec in TABLES_SPEC}
+
+
+def _parsed(response):
+    """Decode a handler response body once and memoize it on the response"""
+    body = response.get("_parsed")
+    if body is None:
+        body = response["_parsed"] = json.loads(response["body"])
+    return body
+
+
+def _seed(table, items):
+    """Write items through one batch writer (25 puts per BatchWriteItem)"""
+    with table.batch_writer() as batch:
+        for item in items:
+            batch.put_item(Item=item)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _env():
+    """Point the handlers at the mocked tables for the whole session"""
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in TABLE_ENV.items():
+            mp.setenv(key, value)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ddb(request):
+    """DynamoDB resource shared by the fixtures and the handlers under test
+
+    Defaults to the dict-backed fake in fake_dynamodb.py, patched in for
+    boto3.resource and boto3.client; pass --use-moto to run the same tests
+    against moto.
+    Under pytest-xdist every worker is its own process with its own
+    backend, so the fixed table names never collide across workers.
+    """
+    if request.config.getoption("--use-moto"):
+        with mock_aws():
+            # One default session shared by the fixtures and the handlers
+            boto3.setup_default_session(region_name="us-east-1")
+            dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+            # Pay the first-call boto3/moto costs once, before any test runs.
+            # moto creates tables synchronously, so nothing waits on them
+            client = dynamodb.meta.client
+            client.list_tables()
+            client.create_table(**TableSpec("warmup", "id").as_kwargs())
+            client.delete_table(TableName="warmup")
+            yield dynamodb
+        return
+
+    fake = FakeDynamoDB()
+
+    def client(service_name, **kwargs):
+        # Nothing may reach real AWS: DynamoDB clients get the fake's
+        # low-level client and any other service fails loudly
+        if service_name != "dynamodb":
+            raise RuntimeError(f"unit tests cannot create a {service_name} client")
+        return fake.client
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(boto3, "resource", lambda service_name, **kwargs: fake)
+        mp.setattr(boto3, "client", client)
+        yield fake
+
+
+@pytest.fixture(scope="session")
+def ddb_client(ddb):
+    """Low-level client, which takes items already in wire format"""
+    if isinstance(ddb, FakeDynamoDB):
+        return ddb.client
+    # Not ddb.meta.client: the resource's client re-marshals every Item
+    return boto3.client("dynamodb", region_name="us-east-1")
+
+
+@pytest.fixture(scope="session")
+def _session_tables(ddb, ddb_client):
+    """Create the TABLES_SPEC tables once per test session"""
+    return create_all(ddb, ddb_client)
+
+
+@pytest.fixture
+def dynamodb_tables(ddb, _session_tables):
+    """Mocked tables, emptied in place after each test (except READONLY_ROWS)"""
+    yield _session_tables
+
+    if isinstance(ddb, FakeDynamoDB):
+        ddb.clear(keep=_READONLY_KEYS)
+        return
+    backend = dynamodb_backends[DEFAULT_ACCOUNT_ID]["us-east-1"]
+    for name in _session_tables:
+        items = backend.tables[name].items
+        kept = _READONLY_KEYS.get(name, ())
+        for key in [k for k in items if k.value not in kept]:
+            del items[key]
+
+
+@pytest.fixture(scope="session")
+def _readonly_rows(_session_tables):
+    """Seed READONLY_ROWS once per session; the per-test clear leaves them"""
+    for name, rows in READONLY_ROWS.items():
+        _seed(_session_tables[name], rows)
+
+
+@pytest.fixture
+def foreign_dog(_readonly_rows, dogs_table):
+    """Session-seeded dog owned by another user (read-only)"""
+    return READONLY_ROWS["dogs-test"][0]
+
+
+@pytest.fixture
+def foreign_booking(_readonly_rows, bookings_table):
+    """Session-seeded pending booking owned by another user (read-only)"""
+    return READONLY_ROWS["bookings-test"][0]
+
+
+@pytest.fixture
+def dogs_table(dynamodb_tables):
+    return dynamodb_tables["dogs-test"]
+
+
+@pytest.fixture
+def owners_table(dynamodb_tables):
+    return dynamodb_tables["owners-test"]
+
+
+@pytest.fixture
+def bookings_table(dynamodb_tables):
+    return dynamodb_tables["bookings-test"]
+
+
+@pytest.fixture
+def venues_table(dynamodb_tables):
+    return dynamodb_tables["venues-test"]
+
+
+@pytest.fixture
+def slots_table(dynamodb_tables):
+    return dynamodb_tables["slots-test"]
+
+
+@pytest.fixture
+def seed():
+    """seed(table, items) - batch-insert fixture data into a mocked table"""
+    return _seed
+
+
+@pytest.fixture
+def parsed():
+    """parsed(response) - JSON body of a handler response, decoded once"""
+    return _parsed
+
+
+class StubMethod:
+    """Callable stand-in for one table operation, recording its calls
+
+    Covers the slice of the MagicMock API the handler tests use:
+    return_value, side_effect (an exception to raise or a function to
+    call), call_count and assert_called_once().
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.return_value = None
+        self.side_effect = None
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is None:
+            return self.return_value
+        if isinstance(self.side_effect, BaseException):
+            raise self.side_effect
+        return self.side_effect(*args, **kwargs)
+
+    @property
+    def call_count(self):
+        return len(self.calls)
+
+    def assert_called_once(self):
+        assert self.call_count == 1, f"called {self.call_count} times"
+
+
+class StubTable:
+    """DynamoDB table whose operations are StubMethods"""
+
+    name = "stub-table"
+
+    def __init__(self):
+        self.put_item = StubMethod()
+        self.get_item = StubMethod()
+        self.scan = StubMethod()
+        self.update_item = StubMethod()
+        self.delete_item = StubMethod()
+        # Scans issued through table.meta.client (which takes a TableName)
+        # land on the same stub as table.scan
+        self.meta = SimpleNamespace(client=SimpleNamespace(scan=self.scan))
+
+
+@pytest.fixture
+def mock_table():
+    """Stub DynamoDB table for handler tests that don't need the fake"""
+    return StubTable()
+
+
+@pytest.fixture
+def put_raw(ddb_client):
+    """put_raw(table_name, wire_item) - write a to_wire() item as-is"""
+
+    def put(table_name, wire_item):
+        ddb_client.put_item(TableName=table_name, Item=wire_item)
+
+    return put
+
+
+_SEEDED_OWNER = {"user_id": "test-user-123", "preferences": {"notifications": True}}
+_SEEDED_OWNER_WIRE = to_wire(_SEEDED_OWNER)
+
+
+@pytest.fixture
+def seeded_owner(owners_table, put_raw):
+    """Owner profile for the mocked auth user (test-user-123)"""
+    put_raw(owners_table.name, _SEEDED_OWNER_WIRE)
+    return _SEEDED_OWNER
@@ -0,0 +1,397 @@
+"""In-process stand-in for the boto3 DynamoDB resource used by the unit tests.
+
+Implements only the table operations the handlers call (get/put/delete,
+query on a GSI, scan (optionally segmented), update_item with simple SET expressions and
+comparison conditions, batch_writer), including Limit/ExclusiveStartKey
+paging and top-level ProjectionExpressions. Items are round-tripped through the
+boto3 type (de)serializers so the handlers see the same Python types
+(Decimal numbers, rejected floats) as they would against DynamoDB.
+Expressions outside that subset fail with a ValidationException.
+"""
+
+import re
+from types import SimpleNamespace
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+# "attr = :value", "attr = attr + :value", "attr = attr - :value"
+_SET_CLAUSE = re.compile(r"^\s*(#?\w+)\s*=\s*(?:(#?\w+)\s*([+-])\s*)?(:\w+)\s*$")
+# "attr >= :value" and friends
+_CONDITION = re.compile(r"^\s*(#?\w+)\s*(=|<>|<=|>=|<|>)\s*(:\w+)\s*$")
+
+_COMPARE = {
+    "=": lambda a, b: a == b,
+    "<>": lambda a, b: a != b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+def to_wire(item):
+    """Marshal a Python item to DynamoDB wire format ({"S": ...} values)"""
+    return {k: _serializer.serialize(v) for k, v in item.items()}
+
+
+def _load(raw):
+    return {k: _deserializer.deserialize(v) for k, v in raw.items()}
+
+
+def _client_error(code, message, operation):
+    return ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+
+def _unsupported(expression, operation):
+    return _client_error(
+        "ValidationException",
+        f"Expression not supported by the fake: {expression}",
+        operation,
+    )
+
+
+def _string_condition(expression, values, names, operation):
+    """Parse "attr <op> :value" into a predicate on an item"""
+    match = _CONDITION.match(expression)
+    if match is None:
+        raise _unsupported(expression, operation)
+    attr, operator, placeholder = match.groups()
+    attr = names.get(attr, attr)
+    expected = values[placeholder]
+    return lambda item: attr in item and _COMPARE[operator](item[attr], expected)
+
+
+def _filter(items, expression, values, names, operation):
+    if expression is None:
+        return items
+    if isinstance(expression, str):
+        predicate = _string_condition(expression, values, names, operation)
+    else:
+        predicate = lambda item: _matches(expression, item)  # noqa: E731
+    return [item for item in items if predicate(item)]
+
+
+def _project(items, projection, names):
+    """Keep the top-level attributes a ProjectionExpression names"""
+    if projection is None:
+        return items
+    attrs = [names.get(a.strip(), a.strip()) for a in projection.split(",")]
+    return [{a: item[a] for a in attrs if a in item} for item in items]
+
+
+def _matches(condition, item):
+    """Evaluate a boto3.dynamodb.conditions Key/Attr condition against an item"""
+    operator = condition.expression_operator
+    values = condition._values
+    if operator == "AND":
+        return all(_matches(c, item) for c in values)
+    if operator == "OR":
+        return any(_matches(c, item) for c in values)
+    if operator == "NOT":
+        return not _matches(values[0], item)
+
+    name = values[0].name
+    if name not in item:
+        return False
+    actual = item[name]
+    if operator == "begins_with":
+        return actual.startswith(values[1])
+    if operator == "BETWEEN":
+        return values[1] <= actual <= values[2]
+    return _COMPARE[operator](actual, values[1])
+
+
+class FakeTable:
+    """Dict-backed table keyed by (hash, range) tuples"""
+
+    def __init__(self, name, key_schema, indexes):
+        self.name = name
+        self._keys = key_schema
+        # index name -> (hash_key, range_key or None)
+        self._indexes = indexes
+        self.items = {}
+        self.meta = SimpleNamespace(client=_TableClient(self))
+
+    def _key(self, key):
+        try:
+            return tuple(key[attr] for attr in self._keys if attr)
+        except KeyError:
+            raise _client_error(
+                "ValidationException",
+                "The provided key element does not match the schema",
+                "GetItem",
+            )
+
+    def put_item(self, Item, **kwargs):
+        raw = to_wire(Item)
+        self.items[self._key(Item)] = raw
+        return {}
+
+    def get_item(
+        self, Key, ProjectionExpression=None, ExpressionAttributeNames=None, **kwargs
+    ):
+        raw = self.items.get(self._key(Key))
+        if raw is None:
+            return {}
+        names = ExpressionAttributeNames or {}
+        [item] = _project([_load(raw)], ProjectionExpression, names)
+        return {"Item": item}
+
+    def delete_item(self, Key, **kwargs):
+        self.items.pop(self._key(Key), None)
+        return {}
+
+    def _page(self, items, key_attrs, limit, start_key):
+        """
+        Resume after start_key and stop after limit items, as DynamoDB does
+        before applying any FilterExpression. Returns the page and its
+        LastEvaluatedKey (None on the last page).
+        """
+        if start_key is not None:
+            start = self._key(start_key)
+            positions = (i for i, item in enumerate(items) if self._key(item) == start)
+            items = items[next(positions, len(items)) + 1:]
+        if limit is None or len(items) <= limit:
+            return items, None
+        last = items[limit - 1]
+        return items[:limit], {attr: last[attr] for attr in key_attrs if attr}
+
+    @staticmethod
+    def _respond(
+        items,
+        last_key,
+        operation,
+        FilterExpression=None,
+        ExpressionAttributeValues=None,
+        ExpressionAttributeNames=None,
+        ProjectionExpression=None,
+        **kwargs,
+    ):
+        names = ExpressionAttributeNames or {}
+        items = _filter(
+            items, FilterExpression, ExpressionAttributeValues or {}, names, operation
+        )
+        items = _project(items, ProjectionExpression, names)
+        response = {"Items": items, "Count": len(items)}
+        if last_key is not None:
+            response["LastEvaluatedKey"] = last_key
+        return response
+
+    def scan(
+        self, Segment=0, TotalSegments=1, Limit=None, ExclusiveStartKey=None, **kwargs
+    ):
+        # Parallel scans get disjoint slices of the keys, like DynamoDB
+        items = [
+            _load(raw)
+            for key, raw in self.items.items()
+            if hash(key) % TotalSegments == Segment
+        ]
+        items, last_key = self._page(items, self._keys, Limit, ExclusiveStartKey)
+        return self._respond(items, last_key, "Scan", **kwargs)
+
+    def query(
+        self,
+        KeyConditionExpression,
+        IndexName=None,
+        ScanIndexForward=True,
+        Limit=None,
+        ExclusiveStartKey=None,
+        **kwargs,
+    ):
+        index_keys = self._indexes[IndexName] if IndexName else self._keys
+        range_key = index_keys[1]
+        items = [
+            item
+            for item in map(_load, self.items.values())
+            if _matches(KeyConditionExpression, item)
+        ]
+        if range_key:
+            items = [i for i in items if range_key in i]
+            items.sort(key=lambda i: i[range_key], reverse=not ScanIndexForward)
+        # A GSI's LastEvaluatedKey carries the index keys as well
+        key_attrs = dict.fromkeys(self._keys + (index_keys if IndexName else ()))
+        items, last_key = self._page(items, key_attrs, Limit, ExclusiveStartKey)
+        return self._respond(items, last_key, "Query", **kwargs)
+
+    def update_item(
+        self,
+        Key,
+        UpdateExpression,
+        ExpressionAttributeValues=None,
+        ExpressionAttributeNames=None,
+        ConditionExpression=None,
+        ReturnValues="NONE",
+        **kwargs,
+    ):
+        values = ExpressionAttributeValues or {}
+        names = ExpressionAttributeNames or {}
+        resolve = lambda token: names.get(token, token)  # noqa: E731
+
+        key = self._key(Key)
+        raw = self.items.get(key)
+        item = _load(raw) if raw is not None else dict(Key)
+
+        if ConditionExpression:
+            condition = _string_condition(
+                ConditionExpression, values, names, "UpdateItem"
+            )
+            if not condition(item):
+                raise _client_error(
+                    "ConditionalCheckFailedException",
+                    "The conditional request failed",
+                    "UpdateItem",
+                )
+
+        expression = UpdateExpression.strip()
+        if not expression.upper().startswith("SET "):
+            raise _unsupported(UpdateExpression, "UpdateItem")
+
+        updated = {}
+        for clause in expression[4:].split(","):
+            match = _SET_CLAUSE.match(clause)
+            if match is None:
+                raise _unsupported(clause, "UpdateItem")
+            target, operand, sign, placeholder = match.groups()
+            value = _deserializer.deserialize(
+                _serializer.serialize(values[placeholder])
+            )
+            if operand:
+                current = item[resolve(operand)]
+                value = current + value if sign == "+" else current - value
+            updated[resolve(target)] = value
+
+        item.update(updated)
+        self.items[key] = to_wire(item)
+
+        if ReturnValues == "ALL_NEW":
+            return {"Attributes": _load(self.items[key])}
+        if ReturnValues == "UPDATED_NEW":
+            return {"Attributes": updated}
+        return {}
+
+    def batch_writer(self, **kwargs):
+        return _BatchWriter(self)
+
+
+class _BatchWriter:
+    def __init__(self, table):
+        self._table = table
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def put_item(self, Item):
+        self._table.put_item(Item=Item)
+
+    def delete_item(self, Key):
+        self._table.delete_item(Key=Key)
+
+
+class _TableClient:
+    """table.meta.client: the resource-level client, which takes TableName
+    and Python-typed items; only the calls the handlers make through it"""
+
+    def __init__(self, table):
+        self._table = table
+
+    def scan(self, TableName, **kwargs):
+        if TableName != self._table.name:
+            raise _client_error(
+                "ResourceNotFoundException", "Requested resource not found", "Scan"
+            )
+        return self._table.scan(**kwargs)
+
+
+class _MissingTable:
+    """Handle for a table that was never created; every operation fails"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, operation):
+        def fail(*args, **kwargs):
+            raise _client_error(
+                "ResourceNotFoundException", "Requested resource not found", operation
+            )
+
+        return fail
+
+
+class _FakeClient:
+    """The slice of the low-level client API that takes wire-format items"""
+
+    def __init__(self, resource):
+        self._resource = resource
+
+    def create_table(self, **kwargs):
+        self._resource.create_table(**kwargs)
+        return {"TableDescription": {"TableName": kwargs["TableName"]}}
+
+    def put_item(self, TableName, Item, **kwargs):
+        # Item is already in wire format ({"S": ...}), so store it as-is
+        table = self._resource.Table(TableName)
+        table.items[table._key(_load(Item))] = dict(Item)
+        return {}
+
+    def batch_write_item(self, RequestItems, **kwargs):
+        for table_name, requests in RequestItems.items():
+            table = self._resource.Table(table_name)
+            for request in requests:
+                if "PutRequest" in request:
+                    self.put_item(table_name, request["PutRequest"]["Item"])
+                else:
+                    key = _load(request["DeleteRequest"]["Key"])
+                    table.delete_item(Key=key)
+        return {"UnprocessedItems": {}}
+
+
+class FakeDynamoDB:
+    """Resource-shaped registry of FakeTables (create_table / Table)"""
+
+    def __init__(self):
+        self.tables = {}
+        self.client = _FakeClient(self)
+
+    def create_table(self, TableName, KeySchema, GlobalSecondaryIndexes=(), **kwargs):
+        if TableName in self.tables:
+            raise _client_error(
+                "ResourceInUseException", "Table already exists", "CreateTable"
+            )
+        self.tables[TableName] = FakeTable(
+            TableName,
+            self._key_pair(KeySchema),
+            {
+                index["IndexName"]: self._key_pair(index["KeySchema"])
+                for index in GlobalSecondaryIndexes
+            },
+        )
+        return self.tables[TableName]
+
+    @staticmethod
+    def _key_pair(key_schema):
+        roles = {k["KeyType"]: k["AttributeName"] for k in key_schema}
+        return roles["HASH"], roles.get("RANGE")
+
+    def Table(self, name):
+        # Mirror boto3, which rejects a missing table name up front but only
+        # finds out that a table does not exist on the first call against it
+        if name is None:
+            raise ValueError("Required parameter name not set")
+        return self.tables.get(name) or _MissingTable(name)
+
+    def clear(self, keep=None):
+        """Empty every table, keeping the schemas
+
+        keep maps a table name to hash-key values whose rows survive.
+        """
+        keep = keep or {}
+        for name, table in self.tables.items():
+            kept = keep.get(name, ())
+            table.items = {k: v for k, v in table.items.items() if k[0] in kept}
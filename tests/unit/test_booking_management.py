@@ -1,160 +1,67 @@
 import json
-import boto3
-from moto import mock_aws
-from unittest.mock import patch
-import sys
-import os
 from datetime import datetime
 from decimal import Decimal
+from types import MappingProxyType
 
-# Add the test directory to the path
-test_dir = os.path.dirname(__file__)
-sys.path.insert(0, test_dir)
+from booking_management.app import lambda_handler, calculate_price
 
-# Set up auth mocks BEFORE importing anything else
-from auth_mock import setup_auth_mocks
+# Seeded booking price (8 hours of daycare at $15/hour), parsed once
+PRICE_120 = Decimal("120.0")
 
-setup_auth_mocks()
-
-# Add the functions directory to the path
-booking_management_dir = os.path.join(
-    os.path.dirname(__file__), "../../functions/booking_management"
+# Read-only event skeletons; each test overlays its own keys onto a copy
+_POST_BOOKINGS = MappingProxyType({"httpMethod": "POST", "path": "/bookings"})
+_GET_BOOKINGS = MappingProxyType({"httpMethod": "GET", "path": "/bookings"})
+_BOOKING_123 = MappingProxyType(
+    {"path": "/bookings/booking-123", "pathParameters": {"id": "booking-123"}}
 )
-sys.path.insert(0, booking_management_dir)
-
-# Remove any existing app module to avoid conflicts
-if "app" in sys.modules:
-    del sys.modules["app"]
 
-from app import lambda_handler, calculate_price
 
-
-@mock_aws
-def test_create_booking():
+def test_create_booking(
+    dogs_table, owners_table, venues_table, slots_table, seed, parsed
+):
     """Test creating a new booking"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create dogs table
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create owners table
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create venues table
-    dynamodb.create_table(
-        TableName="venues-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create bookings table
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create slots table
-    dynamodb.create_table(
-        TableName="slots-test",
-        KeySchema=[
-            {"AttributeName": "venue_date", "KeyType": "HASH"},
-            {"AttributeName": "slot_time", "KeyType": "RANGE"}
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "venue_date", "AttributeType": "S"},
-            {"AttributeName": "slot_time", "AttributeType": "S"},
-            {"AttributeName": "date", "AttributeType": "S"},
-            {"AttributeName": "venue_id", "AttributeType": "S"}
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "date-venue-index",
-                "KeySchema": [
-                    {"AttributeName": "date", "KeyType": "HASH"},
-                    {"AttributeName": "venue_id", "KeyType": "RANGE"}
-                ],
-                "Projection": {"ProjectionType": "ALL"}
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST"
-    )
-
     # Create test data
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={"id": "dog-123", "name": "Buddy", "owner_id": "test-user-123"}
-    )
+    seed(dogs_table, [{"id": "dog-123", "name": "Buddy", "owner_id": "test-user-123"}])
 
-    owners_table = dynamodb.Table("owners-test")
-    owners_table.put_item(
-        Item={"user_id": "test-user-123", "preferences": {"notifications": True}}
+    seed(
+        owners_table,
+        [{"user_id": "test-user-123", "preferences": {"notifications": True}}],
     )
 
-    venues_table = dynamodb.Table("venues-test")
-    venues_table.put_item(
-        Item={
-            "id": "venue-123",
-            "name": "Test Venue",
-            "capacity": 20,
-            "operating_hours": {
-                "monday": {"open": True, "start": "08:00", "end": "18:00"}
+    seed(
+        venues_table,
+        [
+            {
+                "id": "venue-123",
+                "name": "Test Venue",
+                "capacity": 20,
+                "operating_hours": {
+                    "monday": {"open": True, "start": "08:00", "end": "18:00"}
+                },
             },
-        }
+        ],
     )
 
     # Create test slots for the booking date (2024-01-01 is a Monday)
-    slots_table = dynamodb.Table("slots-test")
-    for hour in range(9, 18):  # 09:00 to 17:00
-        slots_table.put_item(
-            Item={
+    seed(
+        slots_table,
+        [
+            {
                 "venue_date": "venue-123#2024-01-01",
                 "slot_time": f"{hour:02d}:00",
                 "venue_id": "venue-123",
                 "date": "2024-01-01",
                 "available_capacity": 20,
                 "total_capacity": 20,
-                "booked_count": 0
+                "booked_count": 0,
             }
-        )
+            for hour in range(9, 18)  # 09:00 to 17:00
+        ],
+    )
 
     # Test event (no owner_id needed - comes from auth)
     event = {
-        "httpMethod": "POST",
-        "path": "/bookings",
+        **_POST_BOOKINGS,
         "body": json.dumps(
             {
                 "dog_id": "dog-123",
@@ -167,20 +74,10 @@ def test_create_booking():
         ),
     }
 
-    with patch.dict(
-        os.environ,
-        {
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "BOOKINGS_TABLE": "bookings-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 201
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert body["dog_id"] == "dog-123"
     assert body["service_type"] == "daycare"
     assert body["status"] == "pending"
@@ -188,88 +85,35 @@ def test_create_booking():
     assert "id" in body
 
 
-@mock_aws
-def test_create_booking_invalid_dog_owner():
+def test_create_booking_invalid_dog_owner(
+    dogs_table, owners_table, venues_table, seed, parsed
+):
     """Test creating booking with dog that doesn't belong to owner"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create all tables
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="venues-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
     # Create test data - dog belongs to different owner
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={"id": "dog-123", "name": "Buddy", "owner_id": "different-user"}
-    )
+    seed(dogs_table, [{"id": "dog-123", "name": "Buddy", "owner_id": "different-user"}])
 
-    owners_table = dynamodb.Table("owners-test")
-    owners_table.put_item(
-        Item={"user_id": "test-user-123", "preferences": {"notifications": True}}
+    seed(
+        owners_table,
+        [{"user_id": "test-user-123", "preferences": {"notifications": True}}],
     )
 
-    venues_table = dynamodb.Table("venues-test")
-    venues_table.put_item(
-        Item={
-            "id": "venue-123",
-            "name": "Test Venue",
-            "capacity": 20,
-            "operating_hours": {
-                "monday": {"open": True, "start": "08:00", "end": "18:00"}
+    seed(
+        venues_table,
+        [
+            {
+                "id": "venue-123",
+                "name": "Test Venue",
+                "capacity": 20,
+                "operating_hours": {
+                    "monday": {"open": True, "start": "08:00", "end": "18:00"}
+                },
             },
-        }
+        ],
     )
 
     # Test event
     event = {
-        "httpMethod": "POST",
-        "path": "/bookings",
+        **_POST_BOOKINGS,
         "body": json.dumps(
             {
                 "dog_id": "dog-123",
@@ -281,303 +125,145 @@ def test_create_booking_invalid_dog_owner():
         ),
     }
 
-    with patch.dict(
-        os.environ,
-        {
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "BOOKINGS_TABLE": "bookings-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 403
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert "Dog does not belong to this owner" in body["error"]
 
 
-@mock_aws
-def test_get_booking():
+def test_get_booking(bookings_table, seed, parsed):
     """Test getting a specific booking"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create bookings table
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
+    # Create test booking
+    seed(
+        bookings_table,
+        [
             {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
+                "id": "booking-123",
+                "dog_id": "dog-123",
+                "owner_id": "test-user-123",
+                "service_type": "daycare",
+                "status": "pending",
+                "price": PRICE_120,
+            },
         ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create test booking
-    bookings_table = dynamodb.Table("bookings-test")
-    bookings_table.put_item(
-        Item={
-            "id": "booking-123",
-            "dog_id": "dog-123",
-            "owner_id": "test-user-123",
-            "service_type": "daycare",
-            "status": "pending",
-            "price": Decimal("120.0"),
-        }
     )
 
     # Test event
-    event = {
-        "httpMethod": "GET",
-        "path": "/bookings/booking-123",
-        "pathParameters": {"id": "booking-123"},
-    }
+    event = {**_BOOKING_123, "httpMethod": "GET"}
 
-    with patch.dict(
-        os.environ,
-        {
-            "BOOKINGS_TABLE": "bookings-test",
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert body["id"] == "booking-123"
     assert body["service_type"] == "daycare"
 
 
-@mock_aws
-def test_list_bookings():
+def test_list_bookings(bookings_table, seed, parsed):
     """Test listing bookings for authenticated user"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create bookings table
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-            {"AttributeName": "start_time", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
+    # Create test bookings
+    seed(
+        bookings_table,
+        [
             {
-                "IndexName": "owner-time-index",
-                "KeySchema": [
-                    {"AttributeName": "owner_id", "KeyType": "HASH"},
-                    {"AttributeName": "start_time", "KeyType": "RANGE"},
-                ],
-                "Projection": {"ProjectionType": "ALL"},
-            }
+                "id": "booking-123",
+                "dog_id": "dog-123",
+                "owner_id": "test-user-123",
+                "service_type": "daycare",
+                "status": "pending",
+                "price": PRICE_120,
+                "start_time": "2024-01-01T09:00:00Z",
+            },
         ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create test bookings
-    bookings_table = dynamodb.Table("bookings-test")
-    bookings_table.put_item(
-        Item={
-            "id": "booking-123",
-            "dog_id": "dog-123",
-            "owner_id": "test-user-123",
-            "service_type": "daycare",
-            "status": "pending",
-            "price": Decimal("120.0"),
-            "start_time": "2024-01-01T09:00:00Z",
-        }
     )
 
     # Test event (no query params needed with auth)
-    event = {
-        "httpMethod": "GET",
-        "path": "/bookings",
-    }
+    event = dict(_GET_BOOKINGS)
 
-    with patch.dict(
-        os.environ,
-        {
-            "BOOKINGS_TABLE": "bookings-test",
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert "bookings" in body
     assert "count" in body
     assert body["count"] == 1
     assert body["bookings"][0]["id"] == "booking-123"
 
 
-@mock_aws
-def test_update_booking():
+def test_update_booking(bookings_table, seed, parsed):
     """Test updating a booking"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create bookings table
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
+    # Create test booking
+    seed(
+        bookings_table,
+        [
             {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
+                "id": "booking-123",
+                "dog_id": "dog-123",
+                "owner_id": "test-user-123",
+                "service_type": "daycare",
+                "status": "pending",
+                "price": PRICE_120,
+            },
         ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create test booking
-    bookings_table = dynamodb.Table("bookings-test")
-    bookings_table.put_item(
-        Item={
-            "id": "booking-123",
-            "dog_id": "dog-123",
-            "owner_id": "test-user-123",
-            "service_type": "daycare",
-            "status": "pending",
-            "price": Decimal("120.0"),
-        }
     )
 
     # Test event
     event = {
+        **_BOOKING_123,
         "httpMethod": "PUT",
-        "path": "/bookings/booking-123",
-        "pathParameters": {"id": "booking-123"},
         "body": json.dumps({"status": "confirmed"}),
     }
 
-    with patch.dict(
-        os.environ,
-        {
-            "BOOKINGS_TABLE": "bookings-test",
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert body["status"] == "confirmed"
 
 
-@mock_aws
-def test_cancel_booking():
+def test_cancel_booking(bookings_table, slots_table, seed, parsed):
     """Test cancelling a booking"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create bookings table
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
+    # Create test booking
+    seed(
+        bookings_table,
+        [
             {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create slots table for capacity release
-    dynamodb.create_table(
-        TableName="slots-test",
-        KeySchema=[
-            {"AttributeName": "venue_date", "KeyType": "HASH"},
-            {"AttributeName": "slot_time", "KeyType": "RANGE"}
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "venue_date", "AttributeType": "S"},
-            {"AttributeName": "slot_time", "AttributeType": "S"},
+                "id": "booking-123",
+                "dog_id": "dog-123",
+                "owner_id": "test-user-123",
+                "venue_id": "venue-123",
+                "service_type": "daycare",
+                "status": "pending",
+                "price": PRICE_120,
+                "start_time": "2024-01-01T09:00:00+00:00",
+                "end_time": "2024-01-01T17:00:00+00:00",
+            },
         ],
-        BillingMode="PAY_PER_REQUEST"
-    )
-
-    # Create test booking
-    bookings_table = dynamodb.Table("bookings-test")
-    bookings_table.put_item(
-        Item={
-            "id": "booking-123",
-            "dog_id": "dog-123",
-            "owner_id": "test-user-123",
-            "venue_id": "venue-123",
-            "service_type": "daycare",
-            "status": "pending",
-            "price": Decimal("120.0"),
-            "start_time": "2024-01-01T09:00:00+00:00",
-            "end_time": "2024-01-01T17:00:00+00:00",
-        }
     )
 
     # Create test slots
-    slots_table = dynamodb.Table("slots-test")
-    for hour in range(9, 17):
-        slots_table.put_item(
-            Item={
+    seed(
+        slots_table,
+        [
+            {
                 "venue_date": "venue-123#2024-01-01",
                 "slot_time": f"{hour:02d}:00",
                 "available_capacity": 15,
                 "total_capacity": 20,
                 "booked_count": 5,
             }
-        )
+            for hour in range(9, 17)
+        ],
+    )
 
     # Test event
-    event = {
-        "httpMethod": "DELETE",
-        "path": "/bookings/booking-123",
-        "pathParameters": {"id": "booking-123"},
-    }
+    event = {**_BOOKING_123, "httpMethod": "DELETE"}
 
-    with patch.dict(
-        os.environ,
-        {
-            "BOOKINGS_TABLE": "bookings-test",
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert body["status"] == "cancelled"
 
     # Verify booking is actually cancelled in DB
@@ -585,30 +271,8 @@ def test_cancel_booking():
     assert verify_response["Item"]["status"] == "cancelled"
 
 
-@mock_aws
-def test_cancel_booking_not_found():
+def test_cancel_booking_not_found(dynamodb_tables, parsed):
     """Test cancelling a non-existent booking"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create bookings table (empty - no booking exists)
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
     # Test event
     event = {
         "httpMethod": "DELETE",
@@ -616,269 +280,100 @@ def test_cancel_booking_not_found():
         "pathParameters": {"id": "nonexistent-booking"},
     }
 
-    with patch.dict(
-        os.environ,
-        {
-            "BOOKINGS_TABLE": "bookings-test",
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 404
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert "Booking not found" in body["error"]
 
 
-@mock_aws
-def test_cancel_already_cancelled_booking():
+def test_cancel_already_cancelled_booking(bookings_table, seed, parsed):
     """Test cancelling a booking that is already cancelled"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create bookings table
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
+    # Create already cancelled booking
+    seed(
+        bookings_table,
+        [
             {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create slots table
-    dynamodb.create_table(
-        TableName="slots-test",
-        KeySchema=[
-            {"AttributeName": "venue_date", "KeyType": "HASH"},
-            {"AttributeName": "slot_time", "KeyType": "RANGE"}
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "venue_date", "AttributeType": "S"},
-            {"AttributeName": "slot_time", "AttributeType": "S"},
+                "id": "booking-123",
+                "dog_id": "dog-123",
+                "owner_id": "test-user-123",
+                "venue_id": "venue-123",
+                "service_type": "daycare",
+                "status": "cancelled",  # Already cancelled
+                "price": PRICE_120,
+                "start_time": "2024-01-01T09:00:00+00:00",
+                "end_time": "2024-01-01T17:00:00+00:00",
+            },
         ],
-        BillingMode="PAY_PER_REQUEST"
-    )
-
-    # Create already cancelled booking
-    bookings_table = dynamodb.Table("bookings-test")
-    bookings_table.put_item(
-        Item={
-            "id": "booking-123",
-            "dog_id": "dog-123",
-            "owner_id": "test-user-123",
-            "venue_id": "venue-123",
-            "service_type": "daycare",
-            "status": "cancelled",  # Already cancelled
-            "price": Decimal("120.0"),
-            "start_time": "2024-01-01T09:00:00+00:00",
-            "end_time": "2024-01-01T17:00:00+00:00",
-        }
     )
 
     # Test event
-    event = {
-        "httpMethod": "DELETE",
-        "path": "/bookings/booking-123",
-        "pathParameters": {"id": "booking-123"},
-    }
+    event = {**_BOOKING_123, "httpMethod": "DELETE"}
 
-    with patch.dict(
-        os.environ,
-        {
-            "BOOKINGS_TABLE": "bookings-test",
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     # Should still return 200 and set status to cancelled (idempotent)
     assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert body["status"] == "cancelled"
 
 
-@mock_aws
-def test_cancel_completed_booking():
+def test_cancel_completed_booking(bookings_table, seed, parsed):
     """Test cancelling a completed booking (should still work)"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create bookings table
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
+    # Create completed booking
+    seed(
+        bookings_table,
+        [
             {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create slots table
-    dynamodb.create_table(
-        TableName="slots-test",
-        KeySchema=[
-            {"AttributeName": "venue_date", "KeyType": "HASH"},
-            {"AttributeName": "slot_time", "KeyType": "RANGE"}
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "venue_date", "AttributeType": "S"},
-            {"AttributeName": "slot_time", "AttributeType": "S"},
+                "id": "booking-123",
+                "dog_id": "dog-123",
+                "owner_id": "test-user-123",
+                "venue_id": "venue-123",
+                "service_type": "daycare",
+                "status": "completed",  # Completed
+                "price": PRICE_120,
+                "start_time": "2024-01-01T09:00:00+00:00",
+                "end_time": "2024-01-01T17:00:00+00:00",
+            },
         ],
-        BillingMode="PAY_PER_REQUEST"
-    )
-
-    # Create completed booking
-    bookings_table = dynamodb.Table("bookings-test")
-    bookings_table.put_item(
-        Item={
-            "id": "booking-123",
-            "dog_id": "dog-123",
-            "owner_id": "test-user-123",
-            "venue_id": "venue-123",
-            "service_type": "daycare",
-            "status": "completed",  # Completed
-            "price": Decimal("120.0"),
-            "start_time": "2024-01-01T09:00:00+00:00",
-            "end_time": "2024-01-01T17:00:00+00:00",
-        }
     )
 
     # Test event
-    event = {
-        "httpMethod": "DELETE",
-        "path": "/bookings/booking-123",
-        "pathParameters": {"id": "booking-123"},
-    }
+    event = {**_BOOKING_123, "httpMethod": "DELETE"}
 
-    with patch.dict(
-        os.environ,
-        {
-            "BOOKINGS_TABLE": "bookings-test",
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     # Should succeed and change status to cancelled
     assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert body["status"] == "cancelled"
 
 
-@mock_aws
-def test_cancel_booking_access_denied():
+def test_cancel_booking_access_denied(bookings_table, foreign_booking, parsed):
     """Test cancelling a booking that doesn't belong to user"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create bookings table
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create slots table
-    dynamodb.create_table(
-        TableName="slots-test",
-        KeySchema=[
-            {"AttributeName": "venue_date", "KeyType": "HASH"},
-            {"AttributeName": "slot_time", "KeyType": "RANGE"}
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "venue_date", "AttributeType": "S"},
-            {"AttributeName": "slot_time", "AttributeType": "S"},
-        ],
-        BillingMode="PAY_PER_REQUEST"
-    )
-
-    # Create booking belonging to different user
-    bookings_table = dynamodb.Table("bookings-test")
-    bookings_table.put_item(
-        Item={
-            "id": "booking-123",
-            "dog_id": "dog-123",
-            "owner_id": "different-user",  # Different owner
-            "venue_id": "venue-123",
-            "service_type": "daycare",
-            "status": "pending",
-            "price": Decimal("120.0"),
-            "start_time": "2024-01-01T09:00:00+00:00",
-            "end_time": "2024-01-01T17:00:00+00:00",
-        }
-    )
-
     # Test event (authenticated as test-user-123)
     event = {
         "httpMethod": "DELETE",
-        "path": "/bookings/booking-123",
-        "pathParameters": {"id": "booking-123"},
+        "path": f"/bookings/{foreign_booking['id']}",
+        "pathParameters": {"id": foreign_booking["id"]},
     }
 
-    with patch.dict(
-        os.environ,
-        {
-            "BOOKINGS_TABLE": "bookings-test",
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     # Should return 403 Access Denied
     assert response["statusCode"] == 403
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert "Access denied" in body["error"]
 
     # Verify the booking was NOT cancelled
-    verify_response = bookings_table.get_item(Key={"id": "booking-123"})
+    verify_response = bookings_table.get_item(Key={"id": foreign_booking["id"]})
     assert verify_response["Item"]["status"] == "pending"
 
 
-def test_missing_required_fields():
+def test_missing_required_fields(parsed):
     """Test booking creation with missing required fields"""
     event = {
-        "httpMethod": "POST",
-        "path": "/bookings",
+        **_POST_BOOKINGS,
         "body": json.dumps(
             {
                 "dog_id": "dog-123",
@@ -887,104 +382,39 @@ def test_missing_required_fields():
         ),
     }
 
-    with patch.dict(
-        os.environ,
-        {
-            "BOOKINGS_TABLE": "bookings-test",
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 422
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert "Field required" in body["error"]
 
 
-@mock_aws
-def test_invalid_service_type():
+def test_invalid_service_type(dogs_table, owners_table, venues_table, seed, parsed):
     """Test booking creation with invalid service type"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create all tables
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="venues-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
     # Create test data
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={"id": "dog-123", "name": "Buddy", "owner_id": "test-user-123"}
-    )
+    seed(dogs_table, [{"id": "dog-123", "name": "Buddy", "owner_id": "test-user-123"}])
 
-    owners_table = dynamodb.Table("owners-test")
-    owners_table.put_item(
-        Item={"user_id": "test-user-123", "preferences": {"notifications": True}}
+    seed(
+        owners_table,
+        [{"user_id": "test-user-123", "preferences": {"notifications": True}}],
     )
 
-    venues_table = dynamodb.Table("venues-test")
-    venues_table.put_item(
-        Item={
-            "id": "venue-123",
-            "name": "Test Venue",
-            "capacity": 20,
-            "operating_hours": {
-                "monday": {"open": True, "start": "08:00", "end": "18:00"}
+    seed(
+        venues_table,
+        [
+            {
+                "id": "venue-123",
+                "name": "Test Venue",
+                "capacity": 20,
+                "operating_hours": {
+                    "monday": {"open": True, "start": "08:00", "end": "18:00"}
+                },
             },
-        }
+        ],
     )
 
     event = {
-        "httpMethod": "POST",
-        "path": "/bookings",
+        **_POST_BOOKINGS,
         "body": json.dumps(
             {
                 "dog_id": "dog-123",
@@ -996,84 +426,39 @@ def test_invalid_service_type():
         ),
     }
 
-    with patch.dict(
-        os.environ,
-        {
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "BOOKINGS_TABLE": "bookings-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 422
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert "service_type:" in body["error"] and "Input should be" in body["error"]
 
 
-@mock_aws
-def test_invalid_datetime():
+def test_invalid_datetime(dogs_table, owners_table, venues_table, seed, parsed):
     """Test booking creation with invalid datetime"""
-    # Setup mock DynamoDB (minimal setup for validation test)
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create minimal tables
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="venues-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
     # Add test data so we can reach datetime validation
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={"id": "dog-123", "name": "Buddy", "owner_id": "test-user-123"}
-    )
+    seed(dogs_table, [{"id": "dog-123", "name": "Buddy", "owner_id": "test-user-123"}])
 
-    owners_table = dynamodb.Table("owners-test")
-    owners_table.put_item(
-        Item={"user_id": "test-user-123", "preferences": {"notifications": True}}
+    seed(
+        owners_table,
+        [{"user_id": "test-user-123", "preferences": {"notifications": True}}],
     )
 
-    venues_table = dynamodb.Table("venues-test")
-    venues_table.put_item(
-        Item={
-            "id": "venue-123",
-            "name": "Test Venue",
-            "capacity": 20,
-            "operating_hours": {
-                "monday": {"open": True, "start": "08:00", "end": "18:00"}
+    seed(
+        venues_table,
+        [
+            {
+                "id": "venue-123",
+                "name": "Test Venue",
+                "capacity": 20,
+                "operating_hours": {
+                    "monday": {"open": True, "start": "08:00", "end": "18:00"}
+                },
             },
-        }
+        ],
     )
 
     event = {
-        "httpMethod": "POST",
-        "path": "/bookings",
+        **_POST_BOOKINGS,
         "body": json.dumps(
             {
                 "dog_id": "dog-123",
@@ -1085,84 +470,41 @@ def test_invalid_datetime():
         ),
     }
 
-    with patch.dict(
-        os.environ,
-        {
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "BOOKINGS_TABLE": "bookings-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 422
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert "start_time:" in body["error"] or "end_time:" in body["error"]
 
 
-@mock_aws
-def test_end_time_before_start_time():
+def test_end_time_before_start_time(
+    dogs_table, owners_table, venues_table, seed, parsed
+):
     """Test booking creation with end time before start time"""
-    # Setup mock DynamoDB (minimal setup for validation test)
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create minimal tables
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="venues-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    dynamodb.create_table(
-        TableName="bookings-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
     # Add test data so we can reach datetime validation
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={"id": "dog-123", "name": "Buddy", "owner_id": "test-user-123"}
-    )
+    seed(dogs_table, [{"id": "dog-123", "name": "Buddy", "owner_id": "test-user-123"}])
 
-    owners_table = dynamodb.Table("owners-test")
-    owners_table.put_item(
-        Item={"user_id": "test-user-123", "preferences": {"notifications": True}}
+    seed(
+        owners_table,
+        [{"user_id": "test-user-123", "preferences": {"notifications": True}}],
     )
 
-    venues_table = dynamodb.Table("venues-test")
-    venues_table.put_item(
-        Item={
-            "id": "venue-123",
-            "name": "Test Venue",
-            "capacity": 20,
-            "operating_hours": {
-                "monday": {"open": True, "start": "08:00", "end": "18:00"}
+    seed(
+        venues_table,
+        [
+            {
+                "id": "venue-123",
+                "name": "Test Venue",
+                "capacity": 20,
+                "operating_hours": {
+                    "monday": {"open": True, "start": "08:00", "end": "18:00"}
+                },
             },
-        }
+        ],
     )
 
     event = {
-        "httpMethod": "POST",
-        "path": "/bookings",
+        **_POST_BOOKINGS,
         "body": json.dumps(
             {
                 "dog_id": "dog-123",
@@ -1174,20 +516,10 @@ def test_end_time_before_start_time():
         ),
     }
 
-    with patch.dict(
-        os.environ,
-        {
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "BOOKINGS_TABLE": "bookings-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 400
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert "Start time must be before end time" in body["error"]
 
 
@@ -1214,41 +546,29 @@ def test_calculate_price():
     assert price == 15.0  # 1 hour minimum
 
 
-def test_method_not_allowed():
+def test_method_not_allowed(parsed):
     """Test unsupported HTTP method"""
     event = {
+        **_POST_BOOKINGS,
         "httpMethod": "PATCH",
-        "path": "/bookings",
         "body": json.dumps({"dog_id": "dog-123"}),
     }
 
-    with patch.dict(
-        os.environ,
-        {
-            "DOGS_TABLE": "dogs-test",
-            "OWNERS_TABLE": "owners-test",
-            "VENUES_TABLE": "venues-test",
-            "BOOKINGS_TABLE": "bookings-test",
-            "SLOTS_TABLE": "slots-test",
-        },
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 405
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert "Method not allowed" in body["error"]
 
 
-def test_exception_handling():
+def test_exception_handling(monkeypatch, parsed):
     """Test exception handling"""
-    event = {
-        "httpMethod": "GET",
-        "path": "/bookings",
-    }
+    event = dict(_GET_BOOKINGS)
 
-    # Don't set up environment variables to trigger exception
+    # Unset the table name to trigger an exception
+    monkeypatch.delenv("BOOKINGS_TABLE")
     response = lambda_handler(event, None)
 
     assert response["statusCode"] == 500
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert "Internal server error" in body["error"]
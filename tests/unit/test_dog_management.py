@@ -1,99 +1,89 @@
 import json
-import boto3
-from moto import mock_aws
-from unittest.mock import patch
-import sys
-import os
-
-# Add the test directory to the path
-test_dir = os.path.dirname(__file__)
-sys.path.insert(0, test_dir)
+import pytest
+from types import MappingProxyType
+
+from dog_management.app import lambda_handler
+
+# Request bodies are static, so encode them once at import time
+_BUDDY_GOLDEN_BODY = json.dumps(
+    {
+        "name": "Buddy",
+        "breed": "Golden Retriever",
+        "date_of_birth": "2021-01-15",
+        "size": "LARGE",
+        "vaccination_status": "VACCINATED",
+        "microchipped": True,
+        "special_needs": ["medication"],
+        "medical_notes": "Takes medication twice daily",
+        "behavior_notes": "Friendly with other dogs",
+        "favorite_activities": "fetch, swimming",
+    }
+)
 
-# Set up auth mocks BEFORE importing anything else
-from auth_mock import setup_auth_mocks
+# Required fields only
+_BUDDY_MINIMAL_BODY = json.dumps(
+    {
+        "name": "Buddy",
+        "breed": "Golden Retriever",
+        "date_of_birth": "2021-06-15",
+        "size": "LARGE",
+        "vaccination_status": "VACCINATED",
+    }
+)
 
-setup_auth_mocks()
+_BUDDY_LABRADOR_BODY = json.dumps(
+    {
+        "name": "Buddy",
+        "breed": "Labrador",
+        "date_of_birth": "2022-06-10",
+        "size": "MEDIUM",
+        "vaccination_status": "NOT_VACCINATED",
+    }
+)
 
-# Add the functions directory to the path
-dog_management_dir = os.path.join(
-    os.path.dirname(__file__), "../../functions/dog_management"
+_VACCINATION_UPDATE_BODY = json.dumps(
+    {
+        "vaccination_status": "VACCINATED",
+        "medical_notes": "Updated medical information",
+    }
 )
-sys.path.insert(0, dog_management_dir)
 
-# Remove any existing app module to avoid conflicts
-if "app" in sys.modules:
-    del sys.modules["app"]
+_GIGANTIC_SIZE_BODY = json.dumps(
+    {
+        "name": "Buddy",
+        "breed": "Labrador",
+        "date_of_birth": "2022-03-15",
+        "size": "GIGANTIC",  # Invalid size
+        "vaccination_status": "VACCINATED",
+    }
+)
 
-from app import lambda_handler
+_RENAME_BODY = json.dumps({"name": "Test"})
 
-# Now import the app module
+# Read-only event skeletons; each test overlays its own keys onto a copy
+_POST_DOGS = MappingProxyType({"httpMethod": "POST", "path": "/dogs"})
+_GET_DOGS = MappingProxyType({"httpMethod": "GET", "path": "/dogs"})
+_DOG_123 = MappingProxyType(
+    {"path": "/dogs/dog-123", "pathParameters": {"id": "dog-123"}}
+)
 
 
-@mock_aws
-def test_create_dog():
+@pytest.mark.parametrize(
+    "request_body",
+    [
+        pytest.param(_BUDDY_GOLDEN_BODY, id="all_fields"),
+        pytest.param(_BUDDY_MINIMAL_BODY, id="required_fields_only"),
+    ],
+)
+def test_create_dog(seeded_owner, parsed, request_body):
     """Test creating a new dog with auth"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create dogs table
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create owners table
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create a test owner profile
-    owners_table = dynamodb.Table("owners-test")
-    owners_table.put_item(
-        Item={"user_id": "test-user-123", "preferences": {"notifications": True}}
-    )
-
     # Test event (no owner_id needed - comes from auth)
-    event = {
-        "httpMethod": "POST",
-        "path": "/dogs",
-        "body": json.dumps(
-            {
-                "name": "Buddy",
-                "breed": "Golden Retriever",
-                "date_of_birth": "2021-01-15",
-                "size": "LARGE",
-                "vaccination_status": "VACCINATED",
-                "microchipped": True,
-                "special_needs": ["medication"],
-                "medical_notes": "Takes medication twice daily",
-                "behavior_notes": "Friendly with other dogs",
-                "favorite_activities": "fetch, swimming",
-            }
-        ),
-    }
+    event = {**_POST_DOGS, "body": request_body}
 
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 201
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert body["name"] == "Buddy"
     assert body["breed"] == "Golden Retriever"
     assert body["owner_id"] == "test-user-123"  # From auth
@@ -101,368 +91,130 @@ def test_create_dog():
     assert body["id"].startswith("dog-")
 
 
-@mock_aws
-def test_create_dog_no_profile():
+def test_create_dog_no_profile(dynamodb_tables):
     """Test creating dog without owner profile"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create dogs table
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create owners table (empty)
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    event = {
-        "httpMethod": "POST",
-        "path": "/dogs",
-        "body": json.dumps(
-            {
-                "name": "Buddy",
-                "breed": "Labrador",
-                "date_of_birth": "2022-06-10",
-                "size": "MEDIUM",
-                "vaccination_status": "NOT_VACCINATED",
-            }
-        ),
-    }
+    event = {**_POST_DOGS, "body": _BUDDY_LABRADOR_BODY}
 
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 400
-    body = json.loads(response["body"])
-    assert "Please complete profile registration first" in body["error"]
+    assert "Please complete profile registration first" in response["body"]
 
 
-@mock_aws
-def test_list_dogs():
+def test_list_dogs(dogs_table, seed, parsed):
     """Test listing dogs for authenticated user"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create dogs table
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
+    # Add test dogs
+    seed(
+        dogs_table,
+        [
             {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
+                "id": "dog-1",
+                "name": "Buddy",
+                "owner_id": "test-user-123",
+                "breed": "Labrador",
+            },
+            {
+                "id": "dog-2",
+                "name": "Max",
+                "owner_id": "test-user-123",
+                "breed": "German Shepherd",
+            },
         ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create owners table
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
     )
 
-    # Add test dogs
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={
-            "id": "dog-1",
-            "name": "Buddy",
-            "owner_id": "test-user-123",
-            "breed": "Labrador",
-        }
-    )
-    dogs_table.put_item(
-        Item={
-            "id": "dog-2",
-            "name": "Max",
-            "owner_id": "test-user-123",
-            "breed": "German Shepherd",
-        }
-    )
+    event = dict(_GET_DOGS)
 
-    event = {
-        "httpMethod": "GET",
-        "path": "/dogs",
-    }
-
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert body["count"] == 2
     assert len(body["dogs"]) == 2
 
 
-@mock_aws
-def test_get_dog():
+def test_get_dog(dogs_table, seed, parsed):
     """Test getting specific dog"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create owners table
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create dogs table
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
+    # Add test dog
+    seed(
+        dogs_table,
+        [
             {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
+                "id": "dog-123",
+                "name": "Buddy",
+                "owner_id": "test-user-123",
+                "breed": "Labrador",
+            },
         ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Add test dog
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={
-            "id": "dog-123",
-            "name": "Buddy",
-            "owner_id": "test-user-123",
-            "breed": "Labrador",
-        }
     )
 
-    event = {
-        "httpMethod": "GET",
-        "path": "/dogs/dog-123",
-        "pathParameters": {"id": "dog-123"},
-    }
+    event = {**_DOG_123, "httpMethod": "GET"}
 
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert body["name"] == "Buddy"
     assert body["owner_id"] == "test-user-123"
 
 
-@mock_aws
-def test_get_dog_access_denied():
+def test_get_dog_access_denied(foreign_dog):
     """Test getting dog that doesn't belong to user"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create owners table
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create dogs table
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Add dog belonging to different user
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={
-            "id": "dog-123",
-            "name": "Buddy",
-            "owner_id": "different-user",
-            "breed": "Labrador",
-        }
-    )
-
     event = {
         "httpMethod": "GET",
-        "path": "/dogs/dog-123",
-        "pathParameters": {"id": "dog-123"},
+        "path": f"/dogs/{foreign_dog['id']}",
+        "pathParameters": {"id": foreign_dog["id"]},
     }
 
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 403
-    body = json.loads(response["body"])
-    assert "Access denied" in body["error"]
+    assert "Access denied" in response["body"]
 
 
-@mock_aws
-def test_update_dog():
+def test_update_dog(dogs_table, seed, parsed):
     """Test updating dog"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create owners table
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create dogs table
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
+    # Add test dog
+    seed(
+        dogs_table,
+        [
             {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
+                "id": "dog-123",
+                "name": "Buddy",
+                "owner_id": "test-user-123",
+                "breed": "Labrador",
+                "age": 2,
+            },
         ],
-        BillingMode="PAY_PER_REQUEST",
     )
 
-    # Add test dog
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={
-            "id": "dog-123",
-            "name": "Buddy",
-            "owner_id": "test-user-123",
-            "breed": "Labrador",
-            "age": 2,
-        }
-    )
+    event = {**_DOG_123, "httpMethod": "PUT", "body": _VACCINATION_UPDATE_BODY}
 
-    event = {
-        "httpMethod": "PUT",
-        "path": "/dogs/dog-123",
-        "pathParameters": {"id": "dog-123"},
-        "body": json.dumps(
-            {
-                "vaccination_status": "VACCINATED",
-                "medical_notes": "Updated medical information",
-            }
-        ),
-    }
-
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 200
-    body = json.loads(response["body"])
+    body = parsed(response)
     assert body["vaccination_status"] == "VACCINATED"
     assert body["medical_notes"] == "Updated medical information"
 
 
-@mock_aws
-def test_delete_dog():
+def test_delete_dog(dogs_table, seed):
     """Test deleting dog"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create owners table
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create dogs table
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
+    # Add test dog
+    seed(
+        dogs_table,
+        [
             {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
+                "id": "dog-123",
+                "name": "Buddy",
+                "owner_id": "test-user-123",
+                "breed": "Labrador",
+            },
         ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Add test dog
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={
-            "id": "dog-123",
-            "name": "Buddy",
-            "owner_id": "test-user-123",
-            "breed": "Labrador",
-        }
     )
 
-    event = {
-        "httpMethod": "DELETE",
-        "path": "/dogs/dog-123",
-        "pathParameters": {"id": "dog-123"},
-    }
+    event = {**_DOG_123, "httpMethod": "DELETE"}
 
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 204
 
@@ -471,222 +223,79 @@ def test_delete_dog():
     assert "Item" not in verify_response
 
 
-@mock_aws
-def test_delete_dog_not_found():
+def test_delete_dog_not_found(dynamodb_tables):
     """Test deleting non-existent dog"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create owners table
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create dogs table (empty - no dog exists)
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
     event = {
         "httpMethod": "DELETE",
         "path": "/dogs/nonexistent-dog",
         "pathParameters": {"id": "nonexistent-dog"},
     }
 
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 404
-    body = json.loads(response["body"])
-    assert "Dog not found" in body["error"]
+    assert "Dog not found" in response["body"]
 
 
-@mock_aws
-def test_delete_dog_access_denied():
+def test_delete_dog_access_denied(dogs_table, foreign_dog):
     """Test deleting dog that doesn't belong to user"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create owners table
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create dogs table
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Add dog belonging to different user
-    dogs_table = dynamodb.Table("dogs-test")
-    dogs_table.put_item(
-        Item={
-            "id": "dog-123",
-            "name": "Buddy",
-            "owner_id": "different-user",  # Different owner
-            "breed": "Labrador",
-        }
-    )
-
     event = {
         "httpMethod": "DELETE",
-        "path": "/dogs/dog-123",
-        "pathParameters": {"id": "dog-123"},
+        "path": f"/dogs/{foreign_dog['id']}",
+        "pathParameters": {"id": foreign_dog["id"]},
     }
 
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 403
-    body = json.loads(response["body"])
-    assert "Access denied" in body["error"]
+    assert "Access denied" in response["body"]
 
     # Verify the dog was NOT deleted
-    verify_response = dogs_table.get_item(Key={"id": "dog-123"})
+    verify_response = dogs_table.get_item(Key={"id": foreign_dog["id"]})
     assert "Item" in verify_response
     assert verify_response["Item"]["name"] == "Buddy"
 
 
-@mock_aws
-def test_invalid_size():
+def test_invalid_size(seeded_owner):
     """Test creating dog with invalid size"""
-    # Setup mock DynamoDB
-    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-    # Create tables
-    dynamodb.create_table(
-        TableName="dogs-test",
-        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-        AttributeDefinitions=[
-            {"AttributeName": "id", "AttributeType": "S"},
-            {"AttributeName": "owner_id", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexes=[
-            {
-                "IndexName": "owner-index",
-                "KeySchema": [{"AttributeName": "owner_id", "KeyType": "HASH"}],
-                "Projection": {"ProjectionType": "ALL"},
-            }
-        ],
-        BillingMode="PAY_PER_REQUEST",
-    )
+    event = {**_POST_DOGS, "body": _GIGANTIC_SIZE_BODY}
 
-    dynamodb.create_table(
-        TableName="owners-test",
-        KeySchema=[{"AttributeName": "user_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "user_id", "AttributeType": "S"}],
-        BillingMode="PAY_PER_REQUEST",
-    )
-
-    # Create owner profile
-    owners_table = dynamodb.Table("owners-test")
-    owners_table.put_item(
-        Item={"user_id": "test-user-123", "preferences": {"notifications": True}}
-    )
-
-    event = {
-        "httpMethod": "POST",
-        "path": "/dogs",
-        "body": json.dumps(
-            {
-                "name": "Buddy",
-                "breed": "Labrador",
-                "date_of_birth": "2022-03-15",
-                "size": "GIGANTIC",  # Invalid size
-                "vaccination_status": "VACCINATED",
-            }
-        ),
-    }
-
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 422
-    body = json.loads(response["body"])
-    assert "size:" in body["error"] and "Input should be" in body["error"]
+    assert "size:" in response["body"] and "Input should be" in response["body"]
 
 
+@pytest.mark.unit
 def test_invalid_json():
     """Test with invalid JSON"""
-    event = {"httpMethod": "POST", "path": "/dogs", "body": "invalid json"}
+    event = {**_POST_DOGS, "body": "invalid json"}
 
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 400
-    body = json.loads(response["body"])
-    assert "Invalid JSON" in body["error"]
+    assert "Invalid JSON" in response["body"]
 
 
+@pytest.mark.unit
 def test_method_not_allowed():
     """Test unsupported HTTP method"""
-    event = {
-        "httpMethod": "PATCH",
-        "path": "/dogs",
-        "body": json.dumps({"name": "Test"}),
-    }
+    event = {**_POST_DOGS, "httpMethod": "PATCH", "body": _RENAME_BODY}
 
-    with patch.dict(
-        os.environ, {"DOGS_TABLE": "dogs-test", "OWNERS_TABLE": "owners-test"}
-    ):
-        response = lambda_handler(event, None)
+    response = lambda_handler(event, None)
 
     assert response["statusCode"] == 405
-    body = json.loads(response["body"])
-    assert "Method not allowed" in body["error"]
+    assert "Method not allowed" in response["body"]
 
 
-@mock_aws
-def test_exception_handling():
+@pytest.mark.unit
+def test_exception_handling(monkeypatch):
     """Test exception handling"""
-    event = {
-        "httpMethod": "GET",
-        "path": "/dogs",
-    }
+    event = dict(_GET_DOGS)
 
-    # Don't set up environment variables to trigger exception
+    # Unset the table name to trigger an exception
+    monkeypatch.delenv("DOGS_TABLE")
     response = lambda_handler(event, None)
 
     assert response["statusCode"] == 500
-    body = json.loads(response["body"])
-    assert "Internal server error" in body["error"]
+    assert "Internal server error" in response["body"]
@@ -1,31 +1,54 @@
 import json
 import pytest
-import sys
 import os
 from unittest.mock import MagicMock, patch
 from datetime import datetime, date, timedelta
 from decimal import Decimal
+from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
-# Add the functions directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "functions"))
-
 from slot_management.app import (
     lambda_handler,
     batch_generate_slots,
     query_availability,
     get_venue_slots_range,
+    query_all_pages,
     generate_slots_for_date,
-    create_response
+    create_response,
+    get_dynamodb,
+    get_dynamodb_client,
+    _day_slot_times,
+    AVAILABILITY_PROJECTION,
+    VENUE_SLOTS_PROJECTION,
+    VENUE_SLOTS_PROJECTION_NAMES,
 )
 
 
 class TestSlotManagement:
     """Test suite for slot management functionality"""
 
+    @pytest.fixture(autouse=True)
+    def fresh_dynamodb(self):
+        """Drop the cached resource so each test's boto3 patch takes effect"""
+        get_dynamodb.cache_clear()
+        get_dynamodb_client.cache_clear()
+        yield
+        get_dynamodb.cache_clear()
+        get_dynamodb_client.cache_clear()
+
     @pytest.fixture
-    def mock_slots_table(self):
-        return MagicMock()
+    def mock_dynamodb_client(self):
+        """Low-level client the slot batch writes go through"""
+        client = MagicMock()
+        client.batch_write_item.return_value = {"UnprocessedItems": {}}
+        with patch("slot_management.app.get_dynamodb_client", return_value=client):
+            yield client
+
+    @pytest.fixture
+    def mock_slots_table(self, mock_dynamodb_client):
+        table = MagicMock()
+        table.name = "slots-test"
+        return table
 
     @pytest.fixture
     def mock_venues_table(self):
@@ -64,14 +87,42 @@ class TestSlotManagement:
 
         assert len(slots) == 0
 
-    def test_batch_generate_slots_success(self, mock_slots_table, mock_venues_table, sample_venue):
+    def test_generate_slots_sub_hour_duration(self, sample_venue):
+        """Test slot times for a duration that doesn't divide the hour"""
+        venue = {**sample_venue, "slot_duration": 45}
+        slots = generate_slots_for_date(venue, "2024-01-06")  # Saturday 10:00-16:00
+
+        assert [slot["time"] for slot in slots[:3]] == ["10:00", "10:45", "11:30"]
+        assert slots[-1]["time"] == "15:15"
+        assert len(slots) == 8
+
+    def test_generated_slots_encode_without_orjson(self, sample_venue):
+        """Test generated slots serialize through the stdlib json fallback"""
+        slots = generate_slots_for_date(sample_venue, "2024-01-01")
+
+        with patch("slot_management.app.orjson", None):
+            response = create_response(200, {"slots": slots})
+
+        assert json.loads(response["body"])["slots"][0] == {
+            "time": "09:00",
+            "available_capacity": 20,
+            "total_capacity": 20,
+        }
+
+    def test_generate_slots_reuses_day_times(self, sample_venue):
+        """Test days with the same hours and duration share one cached computation"""
+        _day_slot_times.cache_clear()
+
+        generate_slots_for_date(sample_venue, "2024-01-01")  # Monday 09:00-17:00
+        generate_slots_for_date({**sample_venue, "id": "venue-456"}, "2024-01-02")
+
+        # Mon-Fri share 09:00-17:00 and Saturday differs: two distinct shapes
+        assert _day_slot_times.cache_info().currsize == 2
+
+    def test_batch_generate_slots_success(self, mock_dynamodb_client, mock_slots_table, mock_venues_table, sample_venue):
         """Test successful batch slot generation"""
         mock_venues_table.get_item.return_value = {"Item": sample_venue}
 
-        # Mock batch writer
-        batch_writer = MagicMock()
-        mock_slots_table.batch_writer.return_value.__enter__.return_value = batch_writer
-
         event = {
             "httpMethod": "POST",
             "path": "/slots/batch-generate",
@@ -88,6 +139,103 @@ class TestSlotManagement:
         body = json.loads(response["body"])
         assert body["venue_id"] == "venue-123"
         assert "Slots generated successfully" in body["message"]
+        # Mon-Wed at 8 slots a day fits in a single 25-item batch
+        assert body["slots_created"] == 24
+        batch_write = mock_dynamodb_client.batch_write_item
+        assert batch_write.call_count == 1
+        assert len(batch_write.call_args.kwargs["RequestItems"]["slots-test"]) == 24
+        last_item = batch_write.call_args.kwargs["RequestItems"]["slots-test"][-1]["PutRequest"]["Item"]
+        # Sent to the low-level client already in wire format
+        assert last_item["venue_date"] == {"S": "venue-123#2024-01-03"}
+        assert last_item["slot_time"] == {"S": "16:00"}
+        assert last_item["available_capacity"] == {"N": "20"}
+        # Midnight UTC on 2024-04-02, 90 days after the slot's date
+        assert last_item["ttl"] == {"N": "1712016000"}
+
+    def test_batch_generate_slots_multiple_batches(self, mock_dynamodb_client, mock_slots_table, mock_venues_table, sample_venue):
+        """Test a range over 25 slots is split across concurrent batches"""
+        mock_venues_table.get_item.return_value = {"Item": sample_venue}
+
+        event = {
+            "httpMethod": "POST",
+            "path": "/slots/batch-generate",
+            "body": json.dumps({
+                "venue_id": "venue-123",
+                "start_date": "2024-01-01",
+                "end_date": "2024-01-07"
+            })
+        }
+
+        response = batch_generate_slots(mock_slots_table, mock_venues_table, event)
+
+        assert response["statusCode"] == 201
+        # Mon-Fri at 8 slots, Saturday at 6, Sunday closed
+        assert json.loads(response["body"])["slots_created"] == 46
+        batch_write = mock_dynamodb_client.batch_write_item
+        sizes = sorted(
+            len(call.kwargs["RequestItems"]["slots-test"])
+            for call in batch_write.call_args_list
+        )
+        assert sizes == [21, 25]
+
+    def test_batch_generate_retries_unprocessed_items(
+        self, mock_dynamodb_client, mock_slots_table, mock_venues_table, sample_venue
+    ):
+        """Test unprocessed batch items are re-sent until written"""
+        mock_venues_table.get_item.return_value = {"Item": sample_venue}
+        batch_write = mock_dynamodb_client.batch_write_item
+
+        def write(RequestItems):
+            # Throttle the first call: hand back its last two requests
+            if batch_write.call_count == 1:
+                return {"UnprocessedItems": {"slots-test": RequestItems["slots-test"][-2:]}}
+            return {"UnprocessedItems": {}}
+
+        batch_write.side_effect = write
+
+        event = {
+            "httpMethod": "POST",
+            "path": "/slots/batch-generate",
+            "body": json.dumps({
+                "venue_id": "venue-123",
+                "start_date": "2024-01-01",
+                "end_date": "2024-01-01"
+            })
+        }
+
+        with patch("slot_management.app.time.sleep") as sleep:
+            response = batch_generate_slots(mock_slots_table, mock_venues_table, event)
+
+        assert response["statusCode"] == 201
+        assert batch_write.call_count == 2
+        assert len(batch_write.call_args.kwargs["RequestItems"]["slots-test"]) == 2
+        sleep.assert_called_once()
+
+    def test_batch_generate_gives_up_on_unprocessed_items(
+        self, mock_dynamodb_client, mock_slots_table, mock_venues_table, sample_venue
+    ):
+        """Test generation fails once retries are exhausted"""
+        mock_venues_table.get_item.return_value = {"Item": sample_venue}
+        mock_dynamodb_client.batch_write_item.side_effect = (
+            lambda RequestItems: {"UnprocessedItems": RequestItems}
+        )
+
+        event = {
+            "httpMethod": "POST",
+            "path": "/slots/batch-generate",
+            "body": json.dumps({
+                "venue_id": "venue-123",
+                "start_date": "2024-01-01",
+                "end_date": "2024-01-01"
+            })
+        }
+
+        with patch("slot_management.app.time.sleep"):
+            response = batch_generate_slots(mock_slots_table, mock_venues_table, event)
+
+        assert response["statusCode"] == 500
+        body = json.loads(response["body"])
+        assert "Failed to generate slots" in body["error"]
 
     def test_query_availability_success(self, mock_slots_table):
         """Test querying availability across venues"""
@@ -123,6 +271,34 @@ class TestSlotManagement:
         assert body["date"] == "2024-01-01"
         assert "venue-1" in body["venues_with_availability"]
         assert "venue-2" in body["venues_with_availability"]
+        assert mock_slots_table.query.call_args.kwargs["ProjectionExpression"] == AVAILABILITY_PROJECTION
+
+    def test_query_availability_follows_pages(self, mock_slots_table):
+        """Test availability is gathered across every page of the GSI query"""
+        last_key = {"date": "2024-01-01", "venue_id": "venue-1", "venue_date": "venue-1#2024-01-01", "slot_time": "09:00"}
+        mock_slots_table.query.side_effect = [
+            {
+                "Items": [{"venue_id": "venue-1", "slot_time": "09:00", "available_capacity": 5, "total_capacity": 20}],
+                "LastEvaluatedKey": last_key,
+            },
+            {
+                "Items": [{"venue_id": "venue-1", "slot_time": "10:00", "available_capacity": 3, "total_capacity": 20}],
+            },
+        ]
+
+        event = {
+            "httpMethod": "GET",
+            "path": "/slots/availability",
+            "queryStringParameters": {"date": "2024-01-01"}
+        }
+
+        response = query_availability(mock_slots_table, event)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert [slot["time"] for slot in body["venues_with_availability"]["venue-1"]] == ["09:00", "10:00"]
+        assert mock_slots_table.query.call_count == 2
+        assert mock_slots_table.query.call_args.kwargs["ExclusiveStartKey"] == last_key
 
     def test_query_availability_missing_date(self, mock_slots_table):
         """Test availability query without date parameter"""
@@ -161,6 +337,71 @@ class TestSlotManagement:
         body = json.loads(response["body"])
         assert body["venue_id"] == "venue-123"
         assert "2024-01-01" in body["slots"]
+        query_kwargs = mock_slots_table.query.call_args.kwargs
+        assert query_kwargs["ProjectionExpression"] == VENUE_SLOTS_PROJECTION
+        assert query_kwargs["ExpressionAttributeNames"] == VENUE_SLOTS_PROJECTION_NAMES
+
+    @staticmethod
+    def _stored_slots(venue_id, date_str, times, available=20):
+        return [
+            {
+                "venue_date": f"{venue_id}#{date_str}",
+                "slot_time": slot_time,
+                "venue_id": venue_id,
+                "date": date_str,
+                "available_capacity": available,
+                "total_capacity": 20,
+                "booked_count": 20 - available,
+                "created_at": "2024-01-01T00:00:00+00:00",
+                "ttl": 1712016000,
+            }
+            for slot_time in times
+        ]
+
+    def test_query_all_pages_against_table(self, slots_table, seed):
+        """Test every page is gathered when the query is paged by Limit"""
+        times = ["09:00", "10:00", "11:00", "12:00", "13:00"]
+        seed(slots_table, self._stored_slots("venue-123", "2024-01-01", times))
+
+        items = query_all_pages(
+            slots_table,
+            KeyConditionExpression=Key("venue_date").eq("venue-123#2024-01-01"),
+            Limit=2,
+        )
+
+        assert [item["slot_time"] for item in items] == times
+
+    def test_query_availability_against_table(self, slots_table, seed):
+        """Test the GSI query filters full slots and projects the read fields"""
+        seed(slots_table, self._stored_slots("venue-1", "2024-01-01", ["09:00"]))
+        seed(slots_table, self._stored_slots("venue-2", "2024-01-01", ["09:00"], available=0))
+
+        event = {"queryStringParameters": {"date": "2024-01-01"}}
+        response = query_availability(slots_table, event)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert list(body["venues_with_availability"]) == ["venue-1"]
+
+    def test_get_venue_slots_range_against_table(self, slots_table, seed):
+        """Test the range returns every documented slot field but not ttl"""
+        seed(slots_table, self._stored_slots("venue-123", "2024-01-01", ["09:00"]))
+
+        event = {"queryStringParameters": {"start_date": "2024-01-01"}}
+        response = get_venue_slots_range(slots_table, "venue-123", event)
+
+        assert response["statusCode"] == 200
+        [slot] = json.loads(response["body"])["slots"]["2024-01-01"]
+        assert set(slot) == {
+            "venue_date",
+            "slot_time",
+            "venue_id",
+            "date",
+            "available_capacity",
+            "total_capacity",
+            "booked_count",
+            "created_at",
+        }
 
     def test_create_response_decimal_serialization(self):
         """Test response creation with Decimal values"""
@@ -170,6 +411,33 @@ class TestSlotManagement:
         body = json.loads(response["body"])
         assert body["capacity"] == 20.5
 
+    def test_create_response_without_orjson(self):
+        """Test response creation falls back to stdlib json"""
+        with patch("slot_management.app.orjson", None):
+            response = create_response(200, {"capacity": Decimal("20.5")})
+
+        assert json.loads(response["body"]) == {"capacity": 20.5}
+
+    def test_batch_generate_without_orjson(self, mock_slots_table, mock_venues_table, sample_venue):
+        """Test request bodies are parsed with stdlib json as a fallback"""
+        mock_venues_table.get_item.return_value = {"Item": sample_venue}
+
+        event = {
+            "httpMethod": "POST",
+            "path": "/slots/batch-generate",
+            "body": json.dumps({
+                "venue_id": "venue-123",
+                "start_date": "2024-01-01",
+                "end_date": "2024-01-01"
+            })
+        }
+
+        with patch("slot_management.app.orjson", None):
+            response = batch_generate_slots(mock_slots_table, mock_venues_table, event)
+
+        assert response["statusCode"] == 201
+        assert json.loads(response["body"])["slots_created"] == 8
+
     def test_batch_generate_missing_fields(self, mock_slots_table, mock_venues_table):
         """Test batch generation with missing required fields"""
         event = {
@@ -246,12 +514,13 @@ class TestSlotManagement:
         body = json.loads(response["body"])
         assert "start_date:" in body["error"] or "end_date:" in body["error"]
 
-    def test_query_availability_invalid_date_format(self, mock_slots_table):
+    @pytest.mark.parametrize("date_str", ["not-a-date", "20240101", "2024-W01-1"])
+    def test_query_availability_invalid_date_format(self, mock_slots_table, date_str):
         """Test availability query with invalid date format"""
         event = {
             "httpMethod": "GET",
             "path": "/slots/availability",
-            "queryStringParameters": {"date": "not-a-date"}
+            "queryStringParameters": {"date": date_str}
         }
 
         response = query_availability(mock_slots_table, event)
@@ -307,10 +576,10 @@ class TestSlotManagement:
         body = json.loads(response["body"])
         assert "Endpoint not found" in body["error"]
 
-    def test_batch_generate_client_error(self, mock_slots_table, mock_venues_table, sample_venue):
+    def test_batch_generate_client_error(self, mock_dynamodb_client, mock_slots_table, mock_venues_table, sample_venue):
         """Test batch generation with DynamoDB client error"""
         mock_venues_table.get_item.return_value = {"Item": sample_venue}
-        mock_slots_table.batch_writer.side_effect = ClientError(
+        mock_dynamodb_client.batch_write_item.side_effect = ClientError(
             {"Error": {"Code": "InternalServerError", "Message": "Test error"}},
             "BatchWriteItem"
         )
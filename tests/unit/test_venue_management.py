@@ -1,12 +1,11 @@
-import json
+import boto3
+import orjson
 import pytest
-import sys
-import os
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import MagicMock
 from datetime import datetime, timezone
-
-# Add the functions directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "functions"))
+from decimal import Decimal
+from botocore.exceptions import ClientError
 
 # Import the functions under test
 from venue_management.app import (
@@ -18,41 +17,107 @@ from venue_management.app import (
     delete_venue,
     validate_operating_hours,
     create_response,
+    get_dynamodb,
+    LIST_VENUES_SEGMENTS,
+    _TIME_RE,
 )
 
 
+def _dumps(obj):
+    # default=dict lets the read-only MappingProxyType fixtures encode as-is
+    return orjson.dumps(obj, default=dict).decode()
+
+
+_loads = orjson.loads
+
+# Weekday hours for sample_venue_data, read-only and shared by reference
+OPERATING_HOURS = MappingProxyType({
+    "monday": {"open": True, "start": "08:00", "end": "18:00"},
+    "tuesday": {"open": True, "start": "08:00", "end": "18:00"},
+    "wednesday": {"open": True, "start": "08:00", "end": "18:00"},
+    "thursday": {"open": True, "start": "08:00", "end": "18:00"},
+    "friday": {"open": True, "start": "08:00", "end": "18:00"},
+    "saturday": {"open": True, "start": "09:00", "end": "17:00"},
+    "sunday": {"open": False},
+})
+
+# Smallest body create_venue accepts
+MINIMAL_VENUE = {
+    "name": "Test Venue",
+    "address": "123 Test St, New York, NY 10001",
+    "latitude": 40.7128,
+    "longitude": -74.0060,
+    "capacity": 20,
+    "operating_hours": {
+        "monday": {"open": True, "start": "08:00", "end": "18:00"}
+    },
+}
+
+
+# lambda_handler events, shared across tests. Plain dicts, not
+# MappingProxyType: the handler json.dumps the event to log it. None of the
+# handlers mutate their event.
+GET_VENUE_EVENT = {
+    "httpMethod": "GET",
+    "path": "/venues/venue-123",
+    "pathParameters": {"id": "venue-123"},
+}
+LIST_VENUES_EVENT = {"httpMethod": "GET", "path": "/venues"}
+UNKNOWN_ENDPOINT_EVENT = {"httpMethod": "GET", "path": "/unknown"}
+
+
+def post_venue_event(body):
+    """POST /venues event carrying body, the one field that varies"""
+    return {"httpMethod": "POST", "path": "/venues", "body": body}
+
+
+# CI distributes by file (--dist=loadfile), which already keeps this class and
+# its session fixtures on one worker; the group does the same under loadgroup
+@pytest.mark.xdist_group(name="venue_mgmt")
 class TestVenueManagement:
     """Test suite for venue management functionality"""
 
-    @pytest.fixture
-    def mock_table(self):
-        """Create a mock DynamoDB table"""
-        table = MagicMock()
-        return table
-
-    @pytest.fixture
+    @pytest.fixture(scope="session")
+    def _boto3_mock(self):
+        """Stand-in for the handler module's boto3, patched in once"""
+        with pytest.MonkeyPatch.context() as mp:
+            fake = MagicMock()
+            mp.setattr("venue_management.app.boto3", fake)
+            yield fake
+
+    @pytest.fixture(autouse=True)
+    def mock_boto3(self, _boto3_mock):
+        """The patched boto3, reset and with the cached resource dropped
+
+        Resetting the session mock is cheaper than patching per test, and
+        clearing get_dynamodb's cache makes each test see a fresh resource.
+        """
+        _boto3_mock.reset_mock(return_value=True, side_effect=True)
+        get_dynamodb.cache_clear()
+        yield _boto3_mock
+        get_dynamodb.cache_clear()
+
+    @pytest.fixture(scope="session")
     def sample_venue_data(self):
-        """Sample venue data for testing"""
-        return {
+        """Sample venue data for testing, shared read-only across the session;
+        tests that need a variant build their own copy"""
+        return MappingProxyType({
             "name": "Downtown Dog Care",
             "address": "123 Main St, New York, NY 10001",
             "latitude": 40.7128,
             "longitude": -74.0060,
             "capacity": 20,
-            "operating_hours": {
-                "monday": {"open": True, "start": "08:00", "end": "18:00"},
-                "tuesday": {"open": True, "start": "08:00", "end": "18:00"},
-                "wednesday": {"open": True, "start": "08:00", "end": "18:00"},
-                "thursday": {"open": True, "start": "08:00", "end": "18:00"},
-                "friday": {"open": True, "start": "08:00", "end": "18:00"},
-                "saturday": {"open": True, "start": "09:00", "end": "17:00"},
-                "sunday": {"open": False},
-            },
+            "operating_hours": OPERATING_HOURS,
             "services": ["daycare", "boarding", "grooming"],
             "slot_duration": 60,
-        }
+        })
 
-    def test_create_venue_success(self, mock_table, sample_venue_data):
+    @pytest.fixture(scope="session")
+    def sample_venue_body(self, sample_venue_data):
+        """sample_venue_data encoded once as a request body"""
+        return _dumps(sample_venue_data)
+
+    def test_create_venue_success(self, mock_table, sample_venue_data, sample_venue_body):
         """Test successful venue creation"""
         mock_table.put_item.return_value = None
 
@@ -60,12 +125,12 @@ class TestVenueManagement:
         mock_slots_table = MagicMock()
         mock_dynamodb.Table.return_value = mock_slots_table
 
-        event = {"body": json.dumps(sample_venue_data), "httpMethod": "POST"}
+        event = {"body": sample_venue_body, "httpMethod": "POST"}
 
         response = create_venue(mock_table, mock_dynamodb, event)
 
         assert response["statusCode"] == 201
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert body["name"] == sample_venue_data["name"]
         assert body["capacity"] == sample_venue_data["capacity"]
         assert "id" in body
@@ -75,90 +140,86 @@ class TestVenueManagement:
     def test_create_venue_missing_required_fields(self, mock_table):
         """Test venue creation with missing required fields"""
         mock_dynamodb = MagicMock()
-        event = {"body": json.dumps({"name": "Test Venue"}), "httpMethod": "POST"}
+        event = {"body": _dumps({"name": "Test Venue"}), "httpMethod": "POST"}
 
         response = create_venue(mock_table, mock_dynamodb, event)
 
         assert response["statusCode"] == 422
-        body = json.loads(response["body"])
-        assert "Field required" in body["error"]
+        assert "Field required" in response["body"]
 
     def test_create_venue_invalid_capacity(self, mock_table, sample_venue_data):
         """Test venue creation with invalid capacity"""
-        sample_venue_data["capacity"] = -5
+        data = {**sample_venue_data, "capacity": -5}
 
         mock_dynamodb = MagicMock()
-        event = {"body": json.dumps(sample_venue_data), "httpMethod": "POST"}
+        event = {"body": _dumps(data), "httpMethod": "POST"}
 
         response = create_venue(mock_table, mock_dynamodb, event)
 
         assert response["statusCode"] == 422
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert "capacity:" in body["error"] and ("greater than 0" in body["error"] or "Input should be" in body["error"])
 
     def test_create_venue_invalid_latitude(self, mock_table, sample_venue_data):
         """Test venue creation with invalid latitude"""
-        sample_venue_data["latitude"] = 100  # Out of range
+        data = {**sample_venue_data, "latitude": 100}  # Out of range
 
         mock_dynamodb = MagicMock()
-        event = {"body": json.dumps(sample_venue_data), "httpMethod": "POST"}
+        event = {"body": _dumps(data), "httpMethod": "POST"}
 
         response = create_venue(mock_table, mock_dynamodb, event)
 
         assert response["statusCode"] == 422
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert "latitude" in body["error"].lower()
 
     def test_create_venue_invalid_longitude(self, mock_table, sample_venue_data):
         """Test venue creation with invalid longitude"""
-        sample_venue_data["longitude"] = -200  # Out of range
+        data = {**sample_venue_data, "longitude": -200}  # Out of range
 
         mock_dynamodb = MagicMock()
-        event = {"body": json.dumps(sample_venue_data), "httpMethod": "POST"}
+        event = {"body": _dumps(data), "httpMethod": "POST"}
 
         response = create_venue(mock_table, mock_dynamodb, event)
 
         assert response["statusCode"] == 422
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert "longitude" in body["error"].lower()
 
     def test_create_venue_missing_coordinates(self, mock_table, sample_venue_data):
         """Test venue creation with missing coordinates"""
-        del sample_venue_data["latitude"]
-        del sample_venue_data["longitude"]
+        data = {
+            key: value
+            for key, value in sample_venue_data.items()
+            if key not in ("latitude", "longitude")
+        }
 
         mock_dynamodb = MagicMock()
-        event = {"body": json.dumps(sample_venue_data), "httpMethod": "POST"}
+        event = {"body": _dumps(data), "httpMethod": "POST"}
 
         response = create_venue(mock_table, mock_dynamodb, event)
 
         assert response["statusCode"] == 422
-        body = json.loads(response["body"])
-        assert "Field required" in body["error"]
+        assert "Field required" in response["body"]
 
-    def test_get_venue_success(self, mock_table):
+    def test_get_venue_success(self, venues_table, seed):
         """Test successful venue retrieval"""
         venue_id = "venue-123"
-        venue_data = {"id": venue_id, "name": "Test Venue", "capacity": 15}
-
-        mock_table.get_item.return_value = {"Item": venue_data}
+        seed(venues_table, [{"id": venue_id, "name": "Test Venue", "capacity": 15}])
 
-        response = get_venue(mock_table, venue_id)
+        response = get_venue(venues_table, venue_id)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert body["id"] == venue_id
         assert body["name"] == "Test Venue"
 
-    def test_get_venue_not_found(self, mock_table):
+    def test_get_venue_not_found(self, venues_table):
         """Test venue retrieval when venue doesn't exist"""
-        mock_table.get_item.return_value = {}
-
-        response = get_venue(mock_table, "nonexistent-venue")
+        response = get_venue(venues_table, "nonexistent-venue")
 
         assert response["statusCode"] == 404
-        body = json.loads(response["body"])
-        assert "not found" in body["error"]
+        assert "not found" in response["body"]
 
     def test_list_venues_success(self, mock_table):
         """Test successful venue listing"""
@@ -166,132 +227,198 @@ class TestVenueManagement:
             {"id": "venue-1", "name": "Venue 1"},
             {"id": "venue-2", "name": "Venue 2"},
         ]
-        mock_table.scan.return_value = {"Items": venues}
+        # One segment holds both venues; the others come back empty
+        mock_table.scan.side_effect = lambda **kwargs: {
+            "Items": venues if kwargs["Segment"] == 0 else []
+        }
 
         event = {"queryStringParameters": None}
         response = list_venues(mock_table, event)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert len(body["venues"]) == 2
         assert body["count"] == 2
+        assert mock_table.scan.call_count == LIST_VENUES_SEGMENTS
+
+    def test_list_venues_follows_pages_and_applies_limit(self, mock_table):
+        """Test segment pages are chained and the total is capped at limit"""
+        pages = {
+            None: {"Items": [{"id": "venue-1"}], "LastEvaluatedKey": {"id": "venue-1"}},
+            "venue-1": {"Items": [{"id": "venue-2"}, {"id": "venue-3"}]},
+        }
+
+        def scan(**kwargs):
+            if kwargs["Segment"]:
+                return {"Items": []}
+            return pages[kwargs.get("ExclusiveStartKey", {}).get("id")]
+
+        mock_table.scan.side_effect = scan
+
+        event = {"queryStringParameters": {"limit": "2"}}
+        response = list_venues(mock_table, event)
+
+        assert response["statusCode"] == 200
+        body = _loads(response["body"])
+        assert [v["id"] for v in body["venues"]] == ["venue-1", "venue-2"]
+
+    def test_list_venues_splits_limit_across_segments(self, mock_table):
+        """Test each page asks for a share of the limit and scanning stops at it"""
+        # Every segment has more pages than the limit needs
+        mock_table.scan.side_effect = lambda **kwargs: {
+            "Items": [{"id": f"venue-{kwargs['Segment']}"}],
+            "LastEvaluatedKey": {"id": "next"},
+        }
+
+        event = {"queryStringParameters": {"limit": "8"}}
+        response = list_venues(mock_table, event)
+
+        assert response["statusCode"] == 200
+        assert _loads(response["body"])["count"] == 8
+        calls = mock_table.scan.calls
+        assert all(kwargs["Limit"] == 2 for _, kwargs in calls)
+        assert all(kwargs["TableName"] == mock_table.name for _, kwargs in calls)
+        # At most one page in flight per segment past the limit
+        assert len(calls) < 8 + LIST_VENUES_SEGMENTS
+
+    def test_list_venues_against_table(self, venues_table, seed):
+        """Test segment pages from the table add up to exactly the limit"""
+        seed(venues_table, [{"id": f"venue-{n}", "name": f"Venue {n}"} for n in range(10)])
+
+        limited = list_venues(venues_table, {"queryStringParameters": {"limit": "5"}})
+        everything = list_venues(venues_table, {"queryStringParameters": None})
 
-    def test_update_venue_success(self, mock_table):
+        assert _loads(limited["body"])["count"] == 5
+        assert _loads(everything["body"])["count"] == 10
+
+    def test_update_venue_success(self, venues_table, seed):
         """Test successful venue update"""
         venue_id = "venue-123"
-        existing_venue = {"id": venue_id, "name": "Old Name"}
-        updated_venue = {"id": venue_id, "name": "New Name"}
-
-        mock_table.get_item.return_value = {"Item": existing_venue}
-        mock_table.update_item.return_value = {"Attributes": updated_venue}
+        seed(venues_table, [{"id": venue_id, "name": "Old Name"}])
 
-        event = {"body": json.dumps({"name": "New Name"}), "httpMethod": "PUT"}
+        event = {"body": _dumps({"name": "New Name"}), "httpMethod": "PUT"}
 
-        response = update_venue(mock_table, venue_id, event)
+        response = update_venue(venues_table, venue_id, event)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert body["name"] == "New Name"
+        assert venues_table.get_item(Key={"id": venue_id})["Item"]["name"] == "New Name"
 
-    def test_update_venue_not_found(self, mock_table):
+    def test_update_venue_not_found(self, venues_table):
         """Test venue update when venue doesn't exist"""
-        mock_table.get_item.return_value = {}
-
-        event = {"body": json.dumps({"name": "New Name"}), "httpMethod": "PUT"}
+        event = {"body": _dumps({"name": "New Name"}), "httpMethod": "PUT"}
 
-        response = update_venue(mock_table, "nonexistent-venue", event)
+        response = update_venue(venues_table, "nonexistent-venue", event)
 
         assert response["statusCode"] == 404
-        body = json.loads(response["body"])
-        assert "not found" in body["error"]
+        assert "not found" in response["body"]
 
-    def test_update_venue_coordinates(self, mock_table):
+    def test_update_venue_coordinates(self, venues_table, seed):
         """Test venue update with coordinates"""
         venue_id = "venue-123"
-        existing_venue = {"id": venue_id, "name": "Test Venue", "latitude": 40.0, "longitude": -73.0}
-        updated_venue = {"id": venue_id, "name": "Test Venue", "latitude": 41.0, "longitude": -74.0}
+        seed(venues_table, [{
+            "id": venue_id,
+            "name": "Test Venue",
+            "latitude": Decimal("40.0"),
+            "longitude": Decimal("-73.0"),
+        }])
 
-        mock_table.get_item.return_value = {"Item": existing_venue}
-        mock_table.update_item.return_value = {"Attributes": updated_venue}
+        event = {"body": _dumps({"latitude": 41.0, "longitude": -74.0}), "httpMethod": "PUT"}
 
-        event = {"body": json.dumps({"latitude": 41.0, "longitude": -74.0}), "httpMethod": "PUT"}
-
-        response = update_venue(mock_table, venue_id, event)
+        response = update_venue(venues_table, venue_id, event)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert body["latitude"] == 41.0
         assert body["longitude"] == -74.0
 
-    def test_update_venue_invalid_latitude(self, mock_table):
+    def test_update_venue_invalid_latitude(self, venues_table, seed):
         """Test venue update with invalid latitude"""
         venue_id = "venue-123"
-        existing_venue = {"id": venue_id, "name": "Test Venue"}
-
-        mock_table.get_item.return_value = {"Item": existing_venue}
+        seed(venues_table, [{"id": venue_id, "name": "Test Venue"}])
 
-        event = {"body": json.dumps({"latitude": 95}), "httpMethod": "PUT"}
+        event = {"body": _dumps({"latitude": 95}), "httpMethod": "PUT"}
 
-        response = update_venue(mock_table, venue_id, event)
+        response = update_venue(venues_table, venue_id, event)
 
         assert response["statusCode"] == 400
-        body = json.loads(response["body"])
-        assert "Latitude must be between -90 and 90" in body["error"]
+        assert "Latitude must be between -90 and 90" in response["body"]
 
-    def test_update_venue_invalid_longitude(self, mock_table):
+    def test_update_venue_invalid_longitude(self, venues_table, seed):
         """Test venue update with invalid longitude"""
         venue_id = "venue-123"
-        existing_venue = {"id": venue_id, "name": "Test Venue"}
-
-        mock_table.get_item.return_value = {"Item": existing_venue}
+        seed(venues_table, [{"id": venue_id, "name": "Test Venue"}])
 
-        event = {"body": json.dumps({"longitude": 200}), "httpMethod": "PUT"}
+        event = {"body": _dumps({"longitude": 200}), "httpMethod": "PUT"}
 
-        response = update_venue(mock_table, venue_id, event)
+        response = update_venue(venues_table, venue_id, event)
 
         assert response["statusCode"] == 400
-        body = json.loads(response["body"])
-        assert "Longitude must be between -180 and 180" in body["error"]
+        assert "Longitude must be between -180 and 180" in response["body"]
 
-    def test_delete_venue_success(self, mock_table):
+    def test_delete_venue_success(self, venues_table, seed):
         """Test successful venue deletion"""
         venue_id = "venue-123"
-        existing_venue = {"id": venue_id, "name": "Test Venue"}
+        seed(venues_table, [{"id": venue_id, "name": "Test Venue"}])
 
-        mock_table.get_item.return_value = {"Item": existing_venue}
-        mock_table.delete_item.return_value = None
-
-        response = delete_venue(mock_table, venue_id)
+        response = delete_venue(venues_table, venue_id)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert "deleted successfully" in body["message"]
+        assert "Item" not in venues_table.get_item(Key={"id": venue_id})
 
-    def test_validate_operating_hours_valid(self):
-        """Test valid operating hours validation"""
-        operating_hours = {
-            "monday": {"open": True, "start": "08:00", "end": "18:00"},
-            "tuesday": {"open": False},
-        }
-
-        assert validate_operating_hours(operating_hours) is True
-
-    def test_validate_operating_hours_invalid_day(self):
-        """Test invalid day in operating hours"""
-        operating_hours = {
-            "invalid_day": {"open": True, "start": "08:00", "end": "18:00"}
-        }
-
-        assert validate_operating_hours(operating_hours) is False
-
-    def test_validate_operating_hours_invalid_time_format(self):
-        """Test invalid time format in operating hours"""
-        operating_hours = {
-            # Invalid format
-            "monday": {"open": True, "start": "8am", "end": "18:00"}
-        }
-
-        assert validate_operating_hours(operating_hours) is False
+    @pytest.mark.parametrize(
+        "operating_hours, expected",
+        [
+            (
+                {
+                    "monday": {"open": True, "start": "08:00", "end": "18:00"},
+                    "tuesday": {"open": False},
+                },
+                True,
+            ),
+            ({"invalid_day": {"open": True, "start": "08:00", "end": "18:00"}}, False),
+            ({"monday": {"open": True, "start": "8am", "end": "18:00"}}, False),
+            # Times must match the schema's HH:MM pattern exactly
+            ({"monday": {"open": True, "start": "8:00", "end": "18:00"}}, False),
+            ({"monday": {"open": True, "start": "08:00", "end": "24:00"}}, False),
+            ({"monday": {"open": True, "start": "08:00"}}, False),
+            ({"monday": "08:00-18:00"}, False),
+            ([], False),
+        ],
+        ids=[
+            "valid",
+            "invalid_day",
+            "invalid_time_format",
+            "unpadded_time",
+            "hour_out_of_range",
+            "missing_end",
+            "day_not_a_dict",
+            "not_a_dict",
+        ],
+    )
+    def test_validate_operating_hours(self, operating_hours, expected):
+        """Test operating hours validation"""
+        assert validate_operating_hours(operating_hours) is expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("00:00", True),
+            ("23:59", True),
+            ("19:30", True),
+            ("24:00", False),
+            ("12:60", False),
+            ("8:00", False),
+            ("08:00:00", False),
+            (" 08:00", False),
+        ],
+    )
+    def test_time_pattern(self, value, expected):
+        """Test the compiled HH:MM pattern behind validate_operating_hours"""
+        assert (_TIME_RE.fullmatch(value) is not None) is expected
 
     def test_create_response_success(self):
         """Test response creation utility"""
@@ -300,22 +427,18 @@ class TestVenueManagement:
         assert response["statusCode"] == 200
         assert response["headers"]["Content-Type"] == "application/json"
         assert response["headers"]["Access-Control-Allow-Origin"] == "*"
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert body["message"] == "Success"
 
     def test_create_response_with_decimal(self):
         """Test response creation with decimal values"""
-        from decimal import Decimal
-
         response = create_response(200, {"price": Decimal("29.99")})
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert body["price"] == 29.99
 
-    @patch.dict("os.environ", {"VENUES_TABLE": "test-venues"})
-    @patch("venue_management.app.boto3")
-    def test_lambda_handler_create_venue(self, mock_boto3, sample_venue_data):
+    def test_lambda_handler_create_venue(self, mock_boto3, sample_venue_data, sample_venue_body):
         """Test lambda handler for venue creation"""
         mock_dynamodb = MagicMock()
         mock_table = MagicMock()
@@ -323,20 +446,12 @@ class TestVenueManagement:
         mock_dynamodb.Table.return_value = mock_table
         mock_table.put_item.return_value = None
 
-        event = {
-            "httpMethod": "POST",
-            "path": "/venues",
-            "body": json.dumps(sample_venue_data),
-        }
-
-        response = lambda_handler(event, None)
+        response = lambda_handler(post_venue_event(sample_venue_body), None)
 
         assert response["statusCode"] == 201
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert body["name"] == sample_venue_data["name"]
 
-    @patch.dict("os.environ", {"VENUES_TABLE": "test-venues"})
-    @patch("venue_management.app.boto3")
     def test_lambda_handler_get_venue(self, mock_boto3):
         """Test lambda handler for venue retrieval"""
         mock_dynamodb = MagicMock()
@@ -347,159 +462,105 @@ class TestVenueManagement:
         venue_data = {"id": "venue-123", "name": "Test Venue"}
         mock_table.get_item.return_value = {"Item": venue_data}
 
-        event = {
-            "httpMethod": "GET",
-            "path": "/venues/venue-123",
-            "pathParameters": {"id": "venue-123"},
-        }
-
-        response = lambda_handler(event, None)
+        response = lambda_handler(GET_VENUE_EVENT, None)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = _loads(response["body"])
         assert body["id"] == "venue-123"
 
-    def test_lambda_handler_missing_env_var(self):
-        """Test lambda handler with missing environment variables"""
-        event = {
-            "httpMethod": "GET",
-            "path": "/venues",
+    def test_lambda_handler_reuses_dynamodb_resource(self, mock_boto3):
+        """Test warm invocations share one DynamoDB resource"""
+        mock_boto3.resource.return_value.Table.return_value.get_item.return_value = {
+            "Item": {"id": "venue-123"}
         }
 
-        response = lambda_handler(event, None)
+        lambda_handler(GET_VENUE_EVENT, None)
+        lambda_handler(GET_VENUE_EVENT, None)
+
+        mock_boto3.resource.assert_called_once()
+
+    def test_lambda_handler_missing_env_var(self, monkeypatch):
+        """Test lambda handler with missing environment variables"""
+        monkeypatch.delenv("VENUES_TABLE", raising=False)
+        # Use the session backend (fake or moto) rather than the mock, so the
+        # unset table name fails the way boto3 itself fails on it
+        monkeypatch.setattr("venue_management.app.boto3", boto3)
+
+        response = lambda_handler(LIST_VENUES_EVENT, None)
 
         assert response["statusCode"] == 500
-        body = json.loads(response["body"])
-        assert "Internal server error" in body["error"]
+        assert "Internal server error" in response["body"]
 
     def test_lambda_handler_invalid_json(self):
         """Test lambda handler with invalid JSON"""
-        with patch.dict("os.environ", {"VENUES_TABLE": "test-venues"}):
-            with patch("venue_management.app.boto3"):
-                event = {
-                    "httpMethod": "POST",
-                    "path": "/venues",
-                    "body": "invalid-json",
-                }
+        response = lambda_handler(post_venue_event("invalid-json"), None)
 
-                response = lambda_handler(event, None)
-
-                assert response["statusCode"] == 400
-                body = json.loads(response["body"])
-                assert "Invalid JSON" in body["error"]
+        assert response["statusCode"] == 400
+        assert "Invalid JSON" in response["body"]
 
     def test_lambda_handler_unknown_endpoint(self):
         """Test lambda handler with unknown endpoint"""
-        with patch.dict("os.environ", {"VENUES_TABLE": "test-venues"}):
-            with patch("venue_management.app.boto3"):
-                event = {
-                    "httpMethod": "GET",
-                    "path": "/unknown",
-                }
-
-                response = lambda_handler(event, None)
-
-                assert response["statusCode"] == 404
-                body = json.loads(response["body"])
-                assert "Endpoint not found" in body["error"]
-
-    def test_create_venue_client_error(self, mock_table):
-        """Test venue creation with database error"""
-        from botocore.exceptions import ClientError
-        from unittest.mock import MagicMock
-
-        mock_table.put_item.side_effect = ClientError(
-            error_response={"Error": {"Code": "ValidationException"}},
-            operation_name="PutItem",
-        )
+        response = lambda_handler(UNKNOWN_ENDPOINT_EVENT, None)
 
-        mock_dynamodb = MagicMock()
-        mock_slots_table = MagicMock()
-        mock_dynamodb.Table.return_value = mock_slots_table
-
-        event = {
-            "body": json.dumps(
-                {
-                    "name": "Test Venue",
-                    "address": "123 Test St, New York, NY 10001",
-                    "latitude": 40.7128,
-                    "longitude": -74.0060,
-                    "capacity": 20,
-                    "operating_hours": {
-                        "monday": {"open": True, "start": "08:00", "end": "18:00"}
-                    },
-                }
+        assert response["statusCode"] == 404
+        assert "Endpoint not found" in response["body"]
+
+    @pytest.mark.parametrize(
+        "failing_call, operation, call_handler, expected_error",
+        [
+            (
+                "put_item",
+                "PutItem",
+                lambda table: create_venue(
+                    table,
+                    MagicMock(),
+                    {"body": _dumps(MINIMAL_VENUE), "httpMethod": "POST"},
+                ),
+                "Failed to create venue",
             ),
-            "httpMethod": "POST",
-        }
-
-        response = create_venue(mock_table, mock_dynamodb, event)
-
-        assert response["statusCode"] == 500
-        body = json.loads(response["body"])
-        assert "Failed to create venue" in body["error"]
-
-    def test_get_venue_client_error(self, mock_table):
-        """Test venue retrieval with database error"""
-        from botocore.exceptions import ClientError
-
-        mock_table.get_item.side_effect = ClientError(
-            error_response={"Error": {"Code": "ResourceNotFoundException"}},
-            operation_name="GetItem",
-        )
-
-        response = get_venue(mock_table, "venue-123")
-
-        assert response["statusCode"] == 500
-        body = json.loads(response["body"])
-        assert "Failed to get venue" in body["error"]
-
-    def test_list_venues_client_error(self, mock_table):
-        """Test venue listing with database error"""
-        from botocore.exceptions import ClientError
-
-        mock_table.scan.side_effect = ClientError(
-            error_response={"Error": {"Code": "InternalServerError"}},
-            operation_name="Scan",
-        )
-
-        event = {"queryStringParameters": None}
-        response = list_venues(mock_table, event)
-
-        assert response["statusCode"] == 500
-        body = json.loads(response["body"])
-        assert "Failed to list venues" in body["error"]
-
-    def test_update_venue_client_error(self, mock_table):
-        """Test venue update with database error"""
-        from botocore.exceptions import ClientError
-
-        mock_table.get_item.return_value = {"Item": {"id": "venue-123"}}
-        mock_table.update_item.side_effect = ClientError(
-            error_response={"Error": {"Code": "ValidationException"}},
-            operation_name="UpdateItem",
-        )
-
-        event = {"body": json.dumps({"name": "New Name"}), "httpMethod": "PUT"}
-
-        response = update_venue(mock_table, "venue-123", event)
-
-        assert response["statusCode"] == 500
-        body = json.loads(response["body"])
-        assert "Failed to update venue" in body["error"]
-
-    def test_delete_venue_client_error(self, mock_table):
-        """Test venue deletion with database error"""
-        from botocore.exceptions import ClientError
-
+            (
+                "get_item",
+                "GetItem",
+                lambda table: get_venue(table, "venue-123"),
+                "Failed to get venue",
+            ),
+            (
+                "scan",
+                "Scan",
+                lambda table: list_venues(table, {"queryStringParameters": None}),
+                "Failed to list venues",
+            ),
+            (
+                "update_item",
+                "UpdateItem",
+                lambda table: update_venue(
+                    table,
+                    "venue-123",
+                    {"body": _dumps({"name": "New Name"}), "httpMethod": "PUT"},
+                ),
+                "Failed to update venue",
+            ),
+            (
+                "delete_item",
+                "DeleteItem",
+                lambda table: delete_venue(table, "venue-123"),
+                "Failed to delete venue",
+            ),
+        ],
+        ids=["create", "get", "list", "update", "delete"],
+    )
+    def test_handler_client_error(
+        self, mock_table, failing_call, operation, call_handler, expected_error
+    ):
+        """Test each handler maps a DynamoDB error to a 500"""
+        # update/delete look the venue up before the failing write
         mock_table.get_item.return_value = {"Item": {"id": "venue-123"}}
-        mock_table.delete_item.side_effect = ClientError(
-            error_response={"Error": {"Code": "ConditionalCheckFailedException"}},
-            operation_name="DeleteItem",
+        getattr(mock_table, failing_call).side_effect = ClientError(
+            error_response={"Error": {"Code": "InternalServerError"}},
+            operation_name=operation,
         )
 
-        response = delete_venue(mock_table, "venue-123")
+        response = call_handler(mock_table)
 
         assert response["statusCode"] == 500
-        body = json.loads(response["body"])
-        assert "Failed to delete venue" in body["error"]
+        assert expected_error in response["body"]